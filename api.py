@@ -0,0 +1,269 @@
+"""Headless HTTP API around ResumeAnalyzer
+
+Run with:
+    python api.py --port 8080 --workers 4
+
+Endpoints:
+    POST /analyze  multipart: file (PDF), optional job_description
+    POST /match    JSON: resume_text plus job_description or job_descriptions
+    POST /batch    multipart: up to --max-pending files, optional job_description
+    GET  /health
+
+Add ?wordcloud=1 to /analyze or /batch to include the base64 word cloud.
+"""
+import argparse
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+
+from aiohttp import web
+
+import resume_analyzer
+from resume_analyzer import ExtractionError, ResumeAnalyzer, results_to_json
+
+# Jobs run in ResumeAnalyzer.batch_executor pools, whose workers each hold
+# an analyzer in resume_analyzer._worker_analyzer
+
+
+def _analyze_worker(pdf_bytes, job_description, include_wordcloud):
+    analyzer = resume_analyzer._worker_analyzer
+    results = analyzer.analyze_resume(pdf_bytes, job_description, include_wordcloud)
+    return results_to_json(results, include_wordcloud)
+
+
+def _match_worker(resume_text, job_description, job_descriptions, top_k):
+    analyzer = resume_analyzer._worker_analyzer
+    if job_descriptions is not None:
+        matches = analyzer.match_jobs(resume_text, job_descriptions, top_k)
+        return {'matches': [
+            {
+                'job_id': match['job_id'],
+                'title': match['title'],
+                'percentage': match['percentage'],
+                'matching_keywords': sorted(match['matching_keywords']),
+                'missing_keywords': sorted(match['missing_keywords'])
+            }
+            for match in matches
+        ]}
+
+    percentage, matching, missing = analyzer.calculate_job_match(resume_text, job_description)
+    return {
+        'percentage': percentage,
+        'matching_keywords': sorted(matching),
+        'missing_keywords': sorted(missing)
+    }
+
+
+class ServerBusy(Exception):
+    """Raised when the request queue is full"""
+
+
+class AnalysisService:
+    """Runs analysis in a bounded process pool and rejects work past a queue limit"""
+
+    def __init__(self, workers=None, max_pending=64, analyzer_options=None):
+        self.max_pending = max_pending
+        self.pending = 0
+        self.workers = workers
+        self._analyzer = ResumeAnalyzer(**(analyzer_options or {}))
+        self.executor = self._analyzer.batch_executor(workers)
+
+    def reserve(self, count=1):
+        """Claim queue slots for count jobs, or raise ServerBusy if they do not fit"""
+        if self.pending + count > self.max_pending:
+            raise ServerBusy()
+        self.pending += count
+
+    def release(self, count=1):
+        self.pending -= count
+
+    async def run(self, func, *args, reserved=False):
+        """Run func in the pool, or raise ServerBusy if the queue is full
+
+        Pass reserved=True when the caller already holds a slot from reserve().
+        """
+        if not reserved:
+            self.reserve()
+        executor = self.executor
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            # A worker died and the pool refuses all further work; replace it
+            # once so only the requests already in it fail
+            if self.executor is executor:
+                self.executor = self._analyzer.batch_executor(self.workers)
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            if not reserved:
+                self.release()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+def _wants_wordcloud(request):
+    return request.query.get('wordcloud', '').lower() in ('1', 'true', 'yes')
+
+
+def _error(http_status, message, **extra):
+    return web.json_response({'error': message, **extra}, status=http_status)
+
+
+def _is_text_list(value):
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return False
+    return all(isinstance(item, str) for item in value)
+
+
+async def _read_upload(request):
+    """Collect uploaded files and the job description from a multipart body"""
+    if not request.content_type.startswith('multipart/'):
+        raise web.HTTPBadRequest(reason="Expected multipart/form-data")
+
+    files = []
+    job_description = None
+    reader = await request.multipart()
+    async for part in reader:
+        if part.name in ('file', 'files'):
+            data = bytes(await part.read())
+            files.append((part.filename or f"file{len(files)}", data))
+        elif part.name == 'job_description':
+            job_description = (await part.text()) or None
+    return files, job_description
+
+
+@web.middleware
+async def busy_middleware(request, handler):
+    try:
+        return await handler(request)
+    except ServerBusy:
+        return web.json_response(
+            {'error': "Server busy, retry later"}, status=503, headers={'Retry-After': '1'}
+        )
+    except BrokenProcessPool:
+        return _error(500, "Analysis worker exited, please retry")
+
+
+async def health(request):
+    service = request.app['service']
+    return web.json_response({'status': 'ok', 'pending': service.pending})
+
+
+async def analyze(request):
+    files, job_description = await _read_upload(request)
+    if len(files) != 1:
+        return _error(400, "Upload exactly one PDF as 'file'")
+
+    include_wordcloud = _wants_wordcloud(request)
+    try:
+        results = await request.app['service'].run(
+            _analyze_worker, files[0][1], job_description, include_wordcloud
+        )
+    except ExtractionError as e:
+        return _error(422, str(e), status='extraction_error')
+    return web.json_response(results)
+
+
+async def match(request):
+    try:
+        body = await request.json()
+    except ValueError:
+        return _error(400, "Expected a JSON body")
+    if not isinstance(body, dict):
+        return _error(400, "Expected a JSON object")
+
+    resume_text = body.get('resume_text')
+    job_description = body.get('job_description')
+    job_descriptions = body.get('job_descriptions')
+    top_k = body.get('top_k', 10)
+    if not resume_text or (job_description is None and job_descriptions is None):
+        return _error(400, "Provide resume_text and job_description or job_descriptions")
+    if not isinstance(resume_text, str):
+        return _error(400, "resume_text must be a string")
+    if job_description is not None and not isinstance(job_description, str):
+        return _error(400, "job_description must be a string")
+    if job_descriptions is not None and not _is_text_list(job_descriptions):
+        return _error(400, "job_descriptions must be a list or object of strings")
+    # bool is an int subclass, so reject it explicitly
+    if not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 1:
+        return _error(400, "top_k must be a positive integer")
+
+    results = await request.app['service'].run(
+        _match_worker, resume_text, job_description, job_descriptions, top_k
+    )
+    return web.json_response(results)
+
+
+async def batch(request):
+    files, job_description = await _read_upload(request)
+    if not files:
+        return _error(400, "Upload one or more PDFs as 'files'")
+
+    service = request.app['service']
+    if len(files) > service.max_pending:
+        # It could never fit the queue, so a 503 would only invite endless retries
+        return _error(413, f"At most {service.max_pending} files per batch")
+
+    include_wordcloud = _wants_wordcloud(request)
+    # Reserve room for the whole batch up front so it is accepted or rejected as one
+    service.reserve(len(files))
+
+    async def analyze_one(name, pdf_bytes):
+        try:
+            results = await service.run(
+                _analyze_worker, pdf_bytes, job_description, include_wordcloud,
+                reserved=True
+            )
+            return {'file': name, 'status': 'ok', 'result': results, 'error': None}
+        except ExtractionError as e:
+            return {'file': name, 'status': 'extraction_error', 'result': None, 'error': str(e)}
+        except Exception as e:
+            return {'file': name, 'status': 'error', 'result': None, 'error': str(e)}
+
+    try:
+        results = await asyncio.gather(*(analyze_one(name, data) for name, data in files))
+    finally:
+        service.release(len(files))
+    return web.json_response({'results': results})
+
+
+def create_app(workers=None, max_pending=64, analyzer_options=None,
+               max_upload_bytes=100 * 1024 * 1024):
+    """Build the aiohttp application
+
+    Works with aiohttp.test_utils.TestClient for in-process testing.
+    """
+    app = web.Application(middlewares=[busy_middleware], client_max_size=max_upload_bytes)
+    app['service'] = AnalysisService(workers, max_pending, analyzer_options)
+
+    async def close_service(app):
+        app['service'].close()
+
+    app.on_cleanup.append(close_service)
+    app.router.add_get('/health', health)
+    app.router.add_post('/analyze', analyze)
+    app.router.add_post('/match', match)
+    app.router.add_post('/batch', batch)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume analyzer HTTP API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="analysis processes (default: CPU count)")
+    parser.add_argument('--max-pending', type=int, default=64,
+                        help="queued jobs before requests get 503")
+    parser.add_argument('--tokenizer', choices=ResumeAnalyzer.TOKENIZERS, default='nltk')
+    args = parser.parse_args()
+
+    app = create_app(args.workers, args.max_pending, {'tokenizer': args.tokenizer})
+    web.run_app(app, host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,23 @@
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import streamlit as st
-from resume_analyzer import ResumeAnalyzer
+from resume_analyzer import ExtractionError, ResumeAnalyzer
 import pandas as pd
 
+# Shared result cache bounds: entries expire after an hour, oldest evicted first
+RESULT_CACHE_TTL = 3600
+RESULT_CACHE_ENTRIES = 256
+
+# Background analysis threads shared by all sessions, and the results refresh rate
+BACKGROUND_WORKERS = 4
+POLL_INTERVAL = 0.5
+
+# Worker processes shared by every ranking request
+RANKING_WORKERS = os.cpu_count() or 1
+
 # Page configuration
 st.set_page_config(
     page_title="AI Resume Analyzer",
@@ -52,82 +68,85 @@ def get_analyzer():
 
 analyzer = get_analyzer()
 
-# Header
-st.markdown('<div class="main-header">📄 AI Resume Analyzer</div>', unsafe_allow_html=True)
-st.markdown("Upload your resume and get instant insights on skills, keywords, and job fit!")
 
-# Sidebar
-with st.sidebar:
-    st.header("⚙️ Options")
-    analysis_mode = st.radio(
-        "Analysis Mode",
-        ["Resume Only", "Resume + Job Description"]
-    )
+def run_analysis(job, pdf_bytes, job_description):
+    """Fill job['results'] stage by stage so the page can show early fields"""
+    results = job['results']
+    try:
+        for result in analyzer.analyze_resume_iter(pdf_bytes, job_description):
+            fields = result.fields
+            if result.stage == 'wordcloud':
+                fields = {'wordcloud': fields['wordcloud'].getvalue()}
+            results.update(fields)
+    except Exception as e:
+        job['error'] = e
+    finally:
+        job['done'] = True
 
-    st.markdown("---")
-    st.markdown("### About")
-    st.info(
-        "This tool analyzes your resume using NLP techniques to:\n"
-        "- Extract key information\n"
-        "- Identify skills and keywords\n"
-        "- Calculate job match percentage\n"
-        "- Generate visual insights"
-    )
 
-# Main content
-col1, col2 = st.columns([1, 1])
+@st.cache_resource
+def get_executor():
+    # Shared by every session so analysis never blocks a script thread
+    return ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS)
 
-with col1:
-    st.markdown("### 📤 Upload Resume")
-    uploaded_file = st.file_uploader(
-        "Choose a PDF file",
-        type=['pdf'],
-        help="Upload your resume in PDF format"
-    )
 
-with col2:
-    if analysis_mode == "Resume + Job Description":
-        st.markdown("### 📋 Job Description")
-        job_description = st.text_area(
-            "Paste the job description here",
-            height=200,
-            help="Paste the job description you want to match against"
-        )
-    else:
-        job_description = None
+@st.cache_resource
+def get_batch_executor():
+    # Started once so ranking never spawns a new process pool per click
+    return analyzer.batch_executor(RANKING_WORKERS)
 
-# Analyze button
-if uploaded_file:
-    if st.button("🔍 Analyze Resume", type="primary", use_container_width=True):
-        with st.spinner("Analyzing your resume... Please wait."):
-            try:
-                # Perform analysis
-                results = analyzer.analyze_resume(uploaded_file, job_description)
 
-                # Store results in session state
-                st.session_state['results'] = results
-                st.success("✅ Analysis complete!")
+@st.cache_resource(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def start_analysis(digest, job_description, _pdf_bytes):
+    """Background analysis shared across sessions, keyed by upload digest and job description"""
+    if _pdf_bytes is None:
+        # The entry expired and the upload is gone, so there is nothing to re-analyze
+        raise LookupError("Analysis expired, please upload the resume again")
+    job = {'results': {}, 'done': False, 'error': None, 'started': time.monotonic()}
+    get_executor().submit(run_analysis, job, _pdf_bytes, job_description)
+    return job
 
-            except Exception as e:
-                st.error(f"❌ Error analyzing resume: {str(e)}")
 
-# Display results
-if 'results' in st.session_state:
-    results = st.session_state['results']
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def ranking_details(digest, job_description, _pdf_bytes):
+    """Full analysis of one ranked resume, fetched when its row is selected"""
+    return analyzer.analyze_resume(_pdf_bytes, job_description, include_wordcloud=False)
+
+
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def render_wordcloud(text):
+    """PNG word cloud bytes, cached separately from the analysis"""
+    return analyzer.generate_wordcloud(text).getvalue()
 
+
+def show_pending(message):
+    st.caption(f"⏳ {message}")
+
+
+def show_results(results, job_description, done):
+    """Render whichever analysis sections are ready"""
     st.markdown("---")
     st.markdown('<div class="sub-header">📊 Analysis Results</div>', unsafe_allow_html=True)
 
     # Contact Information
     st.markdown("### 👤 Contact Information")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(f"**📧 Email:** {results['email']}")
-    with col2:
-        st.markdown(f"**📱 Phone:** {results['phone']}")
+    if 'email' not in results:
+        show_pending("Reading the PDF...")
+    else:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown(f"**📧 Email:** {results['email']}")
+        with col2:
+            st.markdown(f"**📱 Phone:** {results['phone']}")
+        with col3:
+            st.markdown(f"**🔗 LinkedIn:** {results['linkedin']}")
 
     # Job Match Score (if available)
-    if results['job_match']:
+    if job_description and 'job_match' not in results:
+        st.markdown("---")
+        st.markdown("### 🎯 Job Match Analysis")
+        show_pending("Matching against the job description...")
+    elif results.get('job_match'):
         st.markdown("---")
         st.markdown("### 🎯 Job Match Analysis")
 
@@ -173,7 +192,9 @@ if 'results' in st.session_state:
     st.markdown("---")
     st.markdown("### 🛠️ Skills Detected")
 
-    if results['skills']:
+    if 'skills' not in results:
+        show_pending("Detecting skills...")
+    elif results['skills']:
         for category, skills in results['skills'].items():
             with st.expander(f"{category.replace('_', ' ').title()} ({len(skills)} skills)", expanded=True):
                 for skill in skills:
@@ -186,32 +207,42 @@ if 'results' in st.session_state:
     st.markdown("---")
     st.markdown("### 📈 Top Keywords")
 
-    col1, col2 = st.columns([1, 1])
+    if 'word_frequency' not in results:
+        show_pending("Counting keywords...")
+    else:
+        col1, col2 = st.columns([1, 1])
 
-    with col1:
-        # Bar chart
-        word_freq_df = pd.DataFrame(
-            list(results['word_frequency'].items()),
-            columns=['Word', 'Frequency']
-        )
-        st.bar_chart(word_freq_df.set_index('Word'))
+        with col1:
+            # Bar chart
+            word_freq_df = pd.DataFrame(
+                list(results['word_frequency'].items()),
+                columns=['Word', 'Frequency']
+            )
+            st.bar_chart(word_freq_df.set_index('Word'))
 
-    with col2:
-        # Table
-        st.dataframe(
-            word_freq_df,
-            use_container_width=True,
-            hide_index=True
-        )
+        with col2:
+            # Table
+            st.dataframe(
+                word_freq_df,
+                use_container_width=True,
+                hide_index=True
+            )
 
     # Word Cloud
     st.markdown("---")
     st.markdown("### ☁️ Word Cloud Visualization")
-    st.image(results['wordcloud'], use_container_width=True)
+    if 'wordcloud' not in results:
+        show_pending("Rendering word cloud...")
+    else:
+        st.image(results['wordcloud'], use_container_width=True)
 
     # Resume Text Preview
-    with st.expander("📄 View Extracted Text"):
-        st.text_area("Resume Text", results['text'], height=300)
+    if 'text' in results:
+        with st.expander("📄 View Extracted Text"):
+            st.text_area("Resume Text", results['text'], height=300)
+
+    if not done:
+        return
 
     # Download Report
     st.markdown("---")
@@ -224,6 +255,7 @@ AI RESUME ANALYZER - ANALYSIS REPORT
 Contact Information:
 - Email: {results['email']}
 - Phone: {results['phone']}
+- LinkedIn: {results['linkedin']}
 
 Skills Detected:
 {chr(10).join([f"- {cat.replace('_', ' ').title()}: {', '.join(skills)}" for cat, skills in results['skills'].items()])}
@@ -237,6 +269,252 @@ Top Keywords:
         mime="text/plain"
     )
 
+
+@st.fragment(run_every=POLL_INTERVAL)
+def show_live_results(job, job_description):
+    """Poll a running analysis and redraw as stages finish"""
+    if job['done']:
+        # Final render happens in a full rerun, which also stops the polling
+        st.rerun()
+    show_results(job['results'], job_description, done=False)
+
+
+# Header
+st.markdown('<div class="main-header">📄 AI Resume Analyzer</div>', unsafe_allow_html=True)
+st.markdown("Upload your resume and get instant insights on skills, keywords, and job fit!")
+
+# Sidebar
+with st.sidebar:
+    st.header("⚙️ Options")
+    analysis_mode = st.radio(
+        "Analysis Mode",
+        ["Resume Only", "Resume + Job Description", "Rank Multiple Resumes"]
+    )
+
+    st.markdown("---")
+    st.markdown("### About")
+    st.info(
+        "This tool analyzes your resume using NLP techniques to:\n"
+        "- Extract key information\n"
+        "- Identify skills and keywords\n"
+        "- Calculate job match percentage\n"
+        "- Generate visual insights"
+    )
+
+# Rank many resumes against one job description
+if analysis_mode == "Rank Multiple Resumes":
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("### 📤 Upload Resumes")
+        uploaded_files = st.file_uploader(
+            "Choose PDF files",
+            type=['pdf'],
+            accept_multiple_files=True,
+            help="Upload every resume you want to rank"
+        )
+
+    with col2:
+        st.markdown("### 📋 Job Description")
+        job_description = st.text_area(
+            "Paste the job description here",
+            height=200,
+            help="Paste the job description to rank resumes against"
+        )
+
+    if uploaded_files and job_description:
+        if st.button("🏆 Rank Resumes", type="primary", use_container_width=True):
+            with st.spinner(f"Scoring {len(uploaded_files)} resumes... Please wait."):
+                # Preprocess the job description once for every resume
+                job_profile = analyzer.build_job_profile(job_description)
+
+                ranking = []
+                failed = []
+                # Batch items are named by upload position, as file names can repeat
+                uploads = [(f.name, f.getvalue()) for f in uploaded_files]
+                files = [(str(index), data) for index, (_, data) in enumerate(uploads)]
+                try:
+                    for item in analyzer.analyze_batch(files, job_profile,
+                                                       workers=RANKING_WORKERS,
+                                                       executor=get_batch_executor()):
+                        name, data = uploads[int(item['file'])]
+                        if item['status'] != 'ok':
+                            failed.append(f"{name}: {item['error']}")
+                            continue
+                        result = item['result']
+                        resume_skills = {
+                            skill for skills in result['skills'].values() for skill in skills
+                        }
+                        # Only leaderboard fields are kept; details are fetched on selection
+                        ranking.append({
+                            'name': name,
+                            'digest': hashlib.sha256(data).hexdigest(),
+                            'percentage': result['job_match']['percentage'],
+                            'matched_skills': sorted(resume_skills & job_profile.skill_set),
+                            'email': result['email']
+                        })
+                except BrokenProcessPool:
+                    # A worker died; start a fresh pool on the next click
+                    get_batch_executor.clear()
+                    failed.append("ranking stopped because a worker process exited, "
+                                  "please try again")
+
+                ranking.sort(key=lambda row: row['percentage'], reverse=True)
+                st.session_state['ranking'] = ranking
+                st.session_state['ranking_job'] = job_description
+                st.session_state['ranking_failed'] = failed
+
+    if 'ranking' in st.session_state:
+        ranking = st.session_state['ranking']
+
+        st.markdown("---")
+        st.markdown('<div class="sub-header">🏆 Leaderboard</div>', unsafe_allow_html=True)
+
+        for message in st.session_state['ranking_failed']:
+            st.warning(f"⚠️ Skipped {message}")
+
+        leaderboard = pd.DataFrame([
+            {
+                'Rank': rank,
+                'Resume': row['name'],
+                'Match %': row['percentage'],
+                'Matched Skills': ', '.join(row['matched_skills']),
+                'Email': row['email']
+            }
+            for rank, row in enumerate(ranking, 1)
+        ])
+        event = st.dataframe(
+            leaderboard,
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            column_config={
+                'Match %': st.column_config.ProgressColumn(
+                    'Match %', min_value=0, max_value=100, format="%.1f%%"
+                )
+            }
+        )
+
+        # Heavy per-resume details are only rendered for the selected row
+        selected = event.selection.rows
+        results = None
+        if not selected:
+            st.info("👆 Select a row to see the full analysis for that resume")
+        else:
+            # Re-read the selected upload; its analysis is cached by digest
+            row = ranking[selected[0]]
+            pdf_bytes = next(
+                (f.getvalue() for f in uploaded_files or ()
+                 if f.name == row['name']
+                 and hashlib.sha256(f.getvalue()).hexdigest() == row['digest']),
+                None
+            )
+            if pdf_bytes is None:
+                st.warning("⚠️ Upload this resume again to see its full analysis")
+            else:
+                with st.spinner("Loading the full analysis..."):
+                    try:
+                        results = ranking_details(row['digest'],
+                                                  st.session_state['ranking_job'], pdf_bytes)
+                    except ExtractionError as e:
+                        st.error(f"❌ Could not read the PDF: {str(e)}")
+
+        if results is not None:
+            st.markdown(f"### 📄 {row['name']}")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown(f"**📧 Email:** {results['email']}")
+            with col2:
+                st.markdown(f"**📱 Phone:** {results['phone']}")
+            with col3:
+                st.markdown(f"**🔗 LinkedIn:** {results['linkedin']}")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("#### ✅ Matching Keywords")
+                for keyword in list(results['job_match']['matching_keywords'])[:20]:
+                    st.markdown(f'<span class="skill-badge">✓ {keyword}</span>',
+                                unsafe_allow_html=True)
+            with col2:
+                st.markdown("#### ❌ Missing Keywords")
+                for keyword in list(results['job_match']['missing_keywords'])[:20]:
+                    st.markdown(f'<span class="skill-badge">✗ {keyword}</span>',
+                                unsafe_allow_html=True)
+
+            if st.session_state.get('wordcloud_for') != row['digest']:
+                if st.button("☁️ Generate Word Cloud"):
+                    st.session_state['wordcloud_for'] = row['digest']
+            if st.session_state.get('wordcloud_for') == row['digest']:
+                with st.spinner("Rendering word cloud..."):
+                    st.image(render_wordcloud(results['text']), use_container_width=True)
+
+            with st.expander("📄 View Extracted Text"):
+                st.text_area("Resume Text", results['text'], height=300)
+
+    st.stop()
+
+# Main content
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    st.markdown("### 📤 Upload Resume")
+    uploaded_file = st.file_uploader(
+        "Choose a PDF file",
+        type=['pdf'],
+        help="Upload your resume in PDF format"
+    )
+
+with col2:
+    if analysis_mode == "Resume + Job Description":
+        st.markdown("### 📋 Job Description")
+        job_description = st.text_area(
+            "Paste the job description here",
+            height=200,
+            help="Paste the job description you want to match against"
+        )
+    else:
+        job_description = None
+
+# Analyze button
+if uploaded_file:
+    if st.button("🔍 Analyze Resume", type="primary", use_container_width=True):
+        pdf_bytes = uploaded_file.getvalue()
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        clicked = time.monotonic()
+        job = start_analysis(digest, job_description, pdf_bytes)
+        if job['error'] is not None and job['started'] < clicked:
+            # An earlier attempt failed and would stay cached for the TTL; retry it
+            start_analysis.clear(digest, job_description, pdf_bytes)
+            start_analysis(digest, job_description, pdf_bytes)
+
+        # Session state only keeps the job key, not the results
+        st.session_state['results_key'] = (digest, job_description)
+
+# Look up this session's analysis among the shared jobs
+job = None
+if 'results_key' in st.session_state:
+    digest, key_job_description = st.session_state['results_key']
+    pdf_bytes = uploaded_file.getvalue() if uploaded_file else None
+    if pdf_bytes is not None and hashlib.sha256(pdf_bytes).hexdigest() != digest:
+        pdf_bytes = None
+    try:
+        job = start_analysis(digest, key_job_description, pdf_bytes)
+    except LookupError as e:
+        del st.session_state['results_key']
+        st.warning(f"⚠️ {str(e)}")
+
+# Display results
+if job is not None:
+    if isinstance(job['error'], ExtractionError):
+        st.error(f"❌ Could not read the PDF: {str(job['error'])}")
+    elif job['error'] is not None:
+        st.error(f"❌ Error analyzing resume: {str(job['error'])}")
+    elif job['done']:
+        show_results(job['results'], key_job_description, done=True)
+    else:
+        show_live_results(job, key_job_description)
+
 else:
     # Instructions when no file is uploaded
     st.info("👆 Upload a resume PDF to get started!")
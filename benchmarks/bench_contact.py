@@ -0,0 +1,75 @@
+"""Micro-benchmark: per-call regex contact lookups vs ContactExtractor
+
+Run from the repository root:
+    python benchmarks/bench_contact.py
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contact_extractor import ContactExtractor  # noqa: E402
+
+RESUME = (
+    "Jane Doe\n"
+    "Senior Software Engineer | jane.doe@example.com | +1 (555) 123-4567\n"
+    "https://www.linkedin.com/in/janedoe  https://github.com/janedoe\n"
+) + (
+    "Led a team of 6 engineers building Python and Kubernetes services that "
+    "processed 12000 events per second across 3 regions.\n"
+) * 200
+
+
+def legacy_email(text):
+    emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    return emails[0] if emails else "Not found"
+
+
+def legacy_phone(text):
+    phones = re.findall(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+    return phones[0] if phones else "Not found"
+
+
+# Email, URL and phone as one alternation, scanned once with finditer
+COMBINED_PATTERN = re.compile('|'.join([
+    f'(?P<email>{ContactExtractor.EMAIL_PATTERN.pattern})',
+    f'(?P<url>(?i:{ContactExtractor.URL_PATTERN.pattern}))',
+    f'(?P<phone>{ContactExtractor.PHONE_PATTERN.pattern})',
+]))
+
+
+def single_pass(text):
+    email = phone = None
+    urls = []
+    for match in COMBINED_PATTERN.finditer(text):
+        if match.lastgroup == 'url':
+            urls.append(match.group(0))
+        elif match.lastgroup == 'email':
+            email = email or match.group(0)
+        else:
+            phone = phone or match.group(0)
+    return email, phone, urls
+
+
+def main(number=2000):
+    extractor = ContactExtractor()
+    runs = {
+        'legacy findall (email + phone)': lambda: (legacy_email(RESUME), legacy_phone(RESUME)),
+        'compiled search (email + phone)': lambda: (extractor.extract_email(RESUME),
+                                                    extractor.extract_phone(RESUME)),
+        'extract (email, phone, urls)': lambda: extractor.extract(RESUME),
+        'single-pass alternation finditer': lambda: single_pass(RESUME),
+    }
+
+    print(f"Document: {len(RESUME)} characters, {number} runs")
+    baseline = None
+    for name, func in runs.items():
+        seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+        baseline = baseline or seconds
+        print(f"{name:<34} {seconds * 1e6:9.1f} us/doc  {baseline / seconds:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
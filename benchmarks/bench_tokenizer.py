@@ -0,0 +1,94 @@
+"""Tokenizer parity check and throughput benchmark: NLTK vs fast backend
+
+Run from the repository root (NLTK punkt data must be installed for the
+parity check, see download_nltk_data.py):
+    python benchmarks/bench_tokenizer.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_analyzer import ResumeAnalyzer  # noqa: E402
+
+# Raw resume snippets covering the punctuation that survives clean_text
+PARITY_CORPUS = [
+    "Senior Software Engineer with 8+ years of experience in Python and Go.",
+    "Skills: C++, C#, Java, JavaScript, TypeScript, Next.js, Node.js, .NET Core",
+    "Built REST APIs with Django/Flask; deployed on AWS (EC2, S3, Lambda).",
+    "Machine Learning, Deep Learning, NLP -- TensorFlow & PyTorch.",
+    "Improved throughput by 35% and cut p95 latency from 1.2s to 300ms.",
+    "Email: jane.doe@example.com | Phone: +1 (555) 123-4567",
+    "Led a team of 6 engineers... delivered the project 2 weeks early!",
+    "Tools: Git, Docker, Kubernetes, Terraform, Jenkins, CI/CD pipelines",
+    "B.Sc. in Computer Science, University of Somewhere, 2015-2019",
+    "Certified Scrum Master (CSM); AWS Certified Solutions Architect.",
+    "Languages: English (native), Spanish (fluent), etc.",
+    "Worked on #1 ranked product; managed $2M budget.",
+    # Periods inside the text, where Punkt decides the sentence breaks
+    "Go. Skills: Python. Education: B.Sc. in Computer Science",
+    "Tools e.g. Docker, i.e. containers. Joined in 2019. Led the team.",
+    "J. Doe, Jr. Engineer at Acme Inc. since Jan. 2020. Remote.",
+]
+
+
+def filtered(analyzer, tokens):
+    return [t for t in tokens if t not in analyzer.stop_words and len(t) > 2]
+
+
+def check_parity(nltk_analyzer, fast_analyzer):
+    """Compare both backends on the parity corpus; returns the mismatch count"""
+    token_matches = 0
+    filtered_matches = 0
+    for sample in PARITY_CORPUS:
+        cleaned = nltk_analyzer.clean_text(sample)
+        expected = nltk_analyzer.tokenize(cleaned)
+        actual = fast_analyzer.tokenize(cleaned)
+        token_matches += expected == actual
+        if filtered(nltk_analyzer, expected) == filtered(nltk_analyzer, actual):
+            filtered_matches += 1
+        if expected != actual:
+            print(f"  mismatch: {cleaned!r}\n    nltk: {expected}\n    fast: {actual}")
+
+    total = len(PARITY_CORPUS)
+    print(f"Parity: {token_matches}/{total} identical token lists, "
+          f"{filtered_matches}/{total} identical filtered tokens")
+    return total - token_matches
+
+
+def throughput(analyzer, cleaned, seconds=1.0):
+    """Tokens per second for one backend"""
+    tokens = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        tokens += len(analyzer.tokenize(cleaned))
+    return tokens / (time.perf_counter() - start)
+
+
+def main():
+    nltk_analyzer = ResumeAnalyzer(tokenizer='nltk')
+    fast_analyzer = ResumeAnalyzer(tokenizer='fast')
+
+    try:
+        from nltk.tokenize import word_tokenize
+        word_tokenize("probe")
+        has_punkt = True
+    except (ImportError, LookupError):
+        has_punkt = False
+
+    mismatches = 0
+    if has_punkt:
+        mismatches = check_parity(nltk_analyzer, fast_analyzer)
+    else:
+        print("SKIPPED parity check: NLTK punkt data not installed, so the nltk backend "
+              "falls back to str.split (see download_nltk_data.py)", file=sys.stderr)
+
+    cleaned = nltk_analyzer.clean_text(' '.join(PARITY_CORPUS * 100))
+    for name, analyzer in (('nltk', nltk_analyzer), ('fast', fast_analyzer)):
+        print(f"{name:<5} {throughput(analyzer, cleaned):>12,.0f} tokens/s")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Memory and speed of string vs interned (Vocabulary) document representations
+
+Builds a synthetic corpus, keeps each document's terms once as string
+Counters and sets and once as EncodedDocuments, and compares retained
+memory plus get_word_frequency and calculate_job_match timings and results.
+Encoding saves memory; matching precomputed string sets can still be
+quicker than matching term ids, whose matches have to be decoded.
+Run from the repository root:
+    python benchmarks/bench_vocabulary.py --docs 2000
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_analyzer import ResumeAnalyzer  # noqa: E402
+from vocabulary import Vocabulary  # noqa: E402
+
+
+def synthetic_texts(analyzer, docs, words_per_doc, vocabulary_size, rng):
+    skills = [skill for found in analyzer.skill_keywords.values() for skill in found]
+    filler = [
+        ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 10)))
+        for _ in range(vocabulary_size)
+    ]
+    words = skills + filler
+    return [' '.join(rng.choice(words) for _ in range(words_per_doc)) for _ in range(docs)]
+
+
+def retained(build):
+    """Objects returned by build() and the bytes they keep allocated"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def timed(func, items):
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--docs', type=int, default=1000)
+    parser.add_argument('--words', type=int, default=900, help="words per document")
+    parser.add_argument('--vocabulary', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    analyzer = ResumeAnalyzer(tokenizer='fast')
+    rng = random.Random(args.seed)
+    texts = synthetic_texts(analyzer, args.docs, args.words, args.vocabulary, rng)
+    job_description = texts[0][:2000]
+
+    # What a ranking service keeps per resume on each path
+    def string_corpus():
+        documents = (analyzer.prepare_document(text) for text in texts)
+        return [(document.token_counts, document.token_set) for document in documents]
+
+    vocabulary = Vocabulary()
+
+    def encoded_corpus():
+        return [analyzer.encode_document(text, vocabulary) for text in texts]
+
+    kept, string_bytes = retained(string_corpus)
+    del kept
+    encoded, encoded_bytes = retained(encoded_corpus)
+
+    print(f"{args.docs} documents, {len(vocabulary)} distinct terms")
+    print(f"strings (Counter + set) {string_bytes / 1024 / 1024:9.1f} MiB")
+    print(f"encoded (ids + counts)  {encoded_bytes / 1024 / 1024:9.1f} MiB incl. vocabulary")
+
+    job_profile = analyzer.build_job_profile(job_description)
+    job_encoded = vocabulary.encode_document(job_profile)
+    string_docs = [analyzer.prepare_document(text) for text in texts[:200]]
+    encoded_docs = encoded[:200]
+
+    for name, docs, job in (('strings', string_docs, job_profile),
+                            ('encoded', encoded_docs, job_encoded)):
+        frequency = timed(lambda doc: analyzer.get_word_frequency(None, document=doc), docs)
+        match = timed(lambda doc: analyzer.calculate_job_match(None, job, document=doc), docs)
+        print(f"{name:<8} get_word_frequency {frequency / len(docs) * 1e6:8.1f} us/doc  "
+              f"calculate_job_match {match / len(docs) * 1e6:8.1f} us/doc")
+
+    mismatches = sum(
+        analyzer.calculate_job_match(None, job_profile, document=s)
+        != analyzer.calculate_job_match(None, job_encoded, document=e)
+        or analyzer.get_word_frequency(None, document=s)
+        != analyzer.get_word_frequency(None, document=e)
+        for s, e in zip(string_docs, encoded_docs)
+    )
+    print(f"Parity: {len(string_docs) - mismatches}/{len(string_docs)} identical results")
+
+
+if __name__ == '__main__':
+    main()
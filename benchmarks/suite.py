@@ -0,0 +1,214 @@
+"""Benchmark suite for the resume analysis pipeline
+
+Generates synthetic resume PDFs locally, times every pipeline stage and
+the end-to-end analyze_resume, and writes machine-readable JSON:
+
+    python benchmarks/suite.py --docs 20 --pages 2 --output before.json
+    python benchmarks/suite.py --docs 20 --pages 2 --compare before.json
+
+Reported per stage: p50/p95/mean latency in milliseconds and documents per
+second; plus the process peak RSS.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    import fitz
+
+from resume_analyzer import ResumeAnalyzer  # noqa: E402
+
+WORDS_PER_PAGE = 450
+SECTION_TITLES = ['Summary', 'Experience', 'Projects', 'Skills', 'Education']
+
+
+def build_vocabulary(analyzer, size, rng):
+    """Skill keywords mixed with synthetic filler words"""
+    skills = [skill for found in analyzer.skill_keywords.values() for skill in found]
+    filler = [
+        ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 10)))
+        for _ in range(max(size - len(skills), 0))
+    ]
+    return skills + filler
+
+
+def synthetic_resume_text(vocabulary, pages, rng, index):
+    header = (
+        f"Candidate {index}\n"
+        f"candidate{index}@example.com | +1 (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}\n"
+        f"https://www.linkedin.com/in/candidate{index}\n"
+    )
+    page_texts = []
+    for page in range(pages):
+        title = SECTION_TITLES[page % len(SECTION_TITLES)]
+        words = ' '.join(rng.choice(vocabulary) for _ in range(WORDS_PER_PAGE))
+        page_texts.append(f"{title}\n{words}.")
+    page_texts[0] = header + page_texts[0]
+    return page_texts
+
+
+def synthetic_resume_pdf(page_texts):
+    """Render page texts into PDF bytes"""
+    doc = fitz.open()
+    for text in page_texts:
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(36, 36, page.rect.width - 36, page.rect.height - 36),
+                            text, fontsize=8)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def summarize(samples):
+    """Latency percentiles in milliseconds and throughput in documents per second"""
+    ordered = sorted(samples)
+
+    def percentile(p):
+        position = (len(ordered) - 1) * p
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    total = sum(ordered)
+    return {
+        'runs': len(ordered),
+        'p50_ms': percentile(0.50) * 1000,
+        'p95_ms': percentile(0.95) * 1000,
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'throughput_per_s': len(ordered) / total if total else None
+    }
+
+
+def time_call(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    analyzer = ResumeAnalyzer(tokenizer=args.tokenizer)
+    vocabulary = build_vocabulary(analyzer, args.vocabulary, rng)
+    job_description = ' '.join(rng.choice(vocabulary) for _ in range(120))
+
+    pdfs = []
+    texts = []
+    for index in range(args.docs):
+        pdf = synthetic_resume_pdf(synthetic_resume_text(vocabulary, args.pages, rng, index))
+        pdfs.append(pdf)
+        texts.append(analyzer.extract_text_from_pdf(pdf))
+
+    stages = {
+        'extract_text_from_pdf': lambda i: analyzer.extract_text_from_pdf(pdfs[i]),
+        'extract_skills': lambda i: analyzer.extract_skills(texts[i]),
+        'get_word_frequency': lambda i: analyzer.get_word_frequency(texts[i]),
+        'calculate_job_match': lambda i: analyzer.calculate_job_match(texts[i], job_description),
+        'analyze_resume': lambda i: analyzer.analyze_resume(
+            pdfs[i], job_description, include_wordcloud=not args.no_wordcloud
+        ),
+    }
+    if not args.no_wordcloud:
+        stages['generate_wordcloud'] = lambda i: analyzer.generate_wordcloud(texts[i])
+
+    results = {}
+    for name, stage in stages.items():
+        # One untimed warm-up call so lazy imports are not measured
+        stage(0)
+        samples = [time_call(stage, i) for _ in range(args.repeat) for i in range(args.docs)]
+        results[name] = summarize(samples)
+        print(f"{name:<24} p50 {results[name]['p50_ms']:9.2f} ms  "
+              f"p95 {results[name]['p95_ms']:9.2f} ms  "
+              f"{results[name]['throughput_per_s']:9.1f} docs/s", file=sys.stderr)
+
+    return {
+        'config': {
+            'docs': args.docs,
+            'pages': args.pages,
+            'vocabulary': args.vocabulary,
+            'repeat': args.repeat,
+            'seed': args.seed,
+            'tokenizer': args.tokenizer,
+            'wordcloud': not args.no_wordcloud,
+            'pdf_bytes_mean': statistics.fmean(len(pdf) for pdf in pdfs),
+            'text_chars_mean': statistics.fmean(len(text) for text in texts)
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pymupdf': getattr(fitz, 'VersionBind', None)
+        },
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'stages': results,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def compare(report, baseline_path):
+    """Print the p50/p95 change of each stage against an earlier report"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    print(f"\nChange vs {baseline_path}:", file=sys.stderr)
+    for name, current in report['stages'].items():
+        previous = baseline.get('stages', {}).get(name)
+        if not previous:
+            print(f"{name:<24} (new stage)", file=sys.stderr)
+            continue
+        changes = []
+        for metric in ('p50_ms', 'p95_ms'):
+            before, after = previous[metric], current[metric]
+            change = (after - before) / before * 100 if before else 0
+            changes.append(f"{metric} {before:8.2f} -> {after:8.2f} ({change:+6.1f}%)")
+        print(f"{name:<24} " + '  '.join(changes), file=sys.stderr)
+
+    rss_before = baseline.get('peak_rss_mb')
+    if rss_before:
+        print(f"{'peak_rss_mb':<24} {rss_before:.1f} -> {report['peak_rss_mb']:.1f}",
+              file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume analysis pipeline")
+    parser.add_argument('--docs', type=int, default=10, help="synthetic resumes to generate")
+    parser.add_argument('--pages', type=int, default=2, help="pages per resume")
+    parser.add_argument('--vocabulary', type=int, default=2000,
+                        help="distinct words to sample resume text from")
+    parser.add_argument('--repeat', type=int, default=3, help="passes over the corpus per stage")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--tokenizer', choices=ResumeAnalyzer.TOKENIZERS, default='nltk')
+    parser.add_argument('--no-wordcloud', action='store_true',
+                        help="skip word cloud rendering")
+    parser.add_argument('--output', '-o', help="write the JSON report here instead of stdout")
+    parser.add_argument('--compare', metavar='JSON', help="baseline report to diff against")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == '__main__':
+    main()
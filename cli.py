@@ -0,0 +1,113 @@
+"""Analyze a directory of resume PDFs from the command line
+
+Writes one JSON line per resume as soon as it is analyzed:
+    python cli.py resumes/ --workers 8 --output results.jsonl
+    find resumes -name '*.pdf' | python cli.py - --output results.jsonl
+    python cli.py resumes/ --output results.jsonl --resume-from results.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+from resume_analyzer import ResumeAnalyzer, results_to_json
+
+
+def iter_pdf_paths(sources):
+    """Yield PDF paths from files, directories (walked recursively) or '-' for stdin"""
+    for source in sources:
+        if source == '-':
+            for line in sys.stdin:
+                path = line.strip()
+                if path:
+                    yield path
+        elif os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith('.pdf'):
+                        yield os.path.join(root, name)
+        else:
+            yield source
+
+
+def read_done_files(path):
+    """Files already recorded in an earlier JSONL output"""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)['file'])
+            except (ValueError, KeyError):
+                # Ignore a line cut short by an interrupted run
+                continue
+    return done
+
+
+def ends_mid_line(path):
+    """True if the file's last line was cut short without a newline"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return False
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b'\n'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch resume analyzer with JSONL output")
+    parser.add_argument('sources', nargs='*', default=['-'],
+                        help="PDF files or directories; '-' reads paths from stdin (default)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--output', '-o', default='-',
+                        help="JSONL output file (default: stdout)")
+    parser.add_argument('--resume-from', metavar='JSONL',
+                        help="skip files already present in this output file")
+    parser.add_argument('--job-description', help="job description text to match against")
+    parser.add_argument('--job-file', help="read the job description from a file")
+    parser.add_argument('--tokenizer', choices=ResumeAnalyzer.TOKENIZERS, default='nltk')
+    parser.add_argument('--wordcloud', action='store_true',
+                        help="include the base64 word cloud in each result")
+    args = parser.parse_args(argv)
+
+    job_description = args.job_description
+    if args.job_file:
+        with open(args.job_file, encoding='utf-8') as f:
+            job_description = f.read()
+
+    done = read_done_files(args.resume_from) if args.resume_from else set()
+    paths = (path for path in iter_pdf_paths(args.sources) if path not in done)
+
+    analyzer = ResumeAnalyzer(tokenizer=args.tokenizer)
+    if args.output == '-':
+        output = sys.stdout
+    else:
+        # Append when resuming so earlier results are kept
+        output = open(args.output, 'a' if args.resume_from else 'w', encoding='utf-8')
+        if args.resume_from and ends_mid_line(args.output):
+            output.write('\n')
+
+    statuses = Counter()
+    try:
+        for item in analyzer.analyze_batch(paths, job_description, args.workers,
+                                           include_wordcloud=args.wordcloud):
+            if item['result'] is not None:
+                item['result'] = results_to_json(item['result'], args.wordcloud)
+            output.write(json.dumps(item) + '\n')
+            output.flush()
+            statuses[item['status']] += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    summary = ', '.join(f"{count} {status}" for status, count in sorted(statuses.items()))
+    print(f"Processed {sum(statuses.values())} resumes ({summary or 'none'}), "
+          f"skipped {len(done)} already done", file=sys.stderr)
+    return 1 if statuses['error'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
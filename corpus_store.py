@@ -0,0 +1,289 @@
+import json
+import mmap
+import os
+
+import numpy as np
+
+from resume_analyzer import AnalyzedDocument, ResumeAnalyzer
+from vocabulary import EncodedDocument, Vocabulary
+
+MAGIC = b'RESCORP1'
+FORMAT_VERSION = 2
+# Every section starts on this boundary so numpy views are aligned
+ALIGNMENT = 8
+CONTACT_FIELDS = ('name', 'email', 'phone', 'linkedin')
+
+
+class CorpusWriter:
+    """Collects analyzed resumes and writes them as one CorpusStore file
+
+    Layout: magic, header length, a JSON header listing every section,
+    then the sections themselves:
+        doc_offsets   uint64  start of each resume's terms (len n + 1)
+        term_ids      uint32  sorted distinct term ids of every resume, concatenated
+        counts        uint32  term frequency for each term_ids entry
+        first_seen    uint32  first-occurrence order for each term_ids entry
+        skill_bits    uint8   packed bitset of detected skills per resume
+        <field>_offsets / <field>_data  contact strings as UTF-8 blobs
+        terms         uint8   the vocabulary in id order, newline separated
+    """
+
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer or ResumeAnalyzer()
+        self.vocabulary = Vocabulary()
+        self.skills = [
+            (category, skill)
+            for category, found in self.analyzer.skill_keywords.items()
+            for skill in found
+        ]
+        self._skill_bits = {pair: bit for bit, pair in enumerate(self.skills)}
+        self._documents = []
+        self._skill_rows = []
+        self._contacts = {field: [] for field in CONTACT_FIELDS}
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, name, results, document=None):
+        """Add the analyze_resume results for one resume
+
+        Term counts come from document, then from the results' 'token_counts'
+        (see analyze_resume), and only otherwise from tokenizing the text.
+        """
+        if document is None:
+            if results.get('token_counts') is not None:
+                document = self.vocabulary.encode_counts(results['token_counts'])
+            else:
+                document = self.analyzer.prepare_document(results['text'])
+        if isinstance(document, AnalyzedDocument):
+            document = self.vocabulary.encode_document(document)
+        self._documents.append(document)
+
+        row = np.zeros(len(self.skills), dtype=np.bool_)
+        for category, found in results['skills'].items():
+            for skill in found:
+                bit = self._skill_bits.get((category, skill))
+                if bit is not None:
+                    row[bit] = True
+        self._skill_rows.append(np.packbits(row))
+
+        record = dict(results, name=name)
+        for field in CONTACT_FIELDS:
+            self._contacts[field].append(record[field] or '')
+
+    def ingest_batch(self, files, workers=None):
+        """Analyze many PDFs in parallel and add each one, yielding every batch result"""
+        # Workers return term counts so the text is not tokenized again here
+        for item in self.analyzer.analyze_batch(files, workers=workers, token_counts=True):
+            if item['status'] == 'ok':
+                self.add(item['file'], item['result'])
+            yield item
+
+    def write(self, path):
+        """Write the corpus to path, replacing any existing file atomically"""
+        documents = self._documents
+        lengths = np.fromiter((len(document) for document in documents), dtype=np.uint64,
+                              count=len(documents))
+        doc_offsets = np.zeros(len(documents) + 1, dtype=np.uint64)
+        np.cumsum(lengths, out=doc_offsets[1:])
+
+        empty = np.zeros(0, dtype=np.uint32)
+        sections = {
+            'doc_offsets': doc_offsets,
+            'term_ids': np.concatenate([d.term_ids for d in documents] or [empty]),
+            'counts': np.concatenate([d.counts for d in documents] or [empty]),
+            'first_seen': np.concatenate([d.first_seen for d in documents] or [empty]),
+            'skill_bits': np.array(self._skill_rows, dtype=np.uint8).reshape(
+                len(documents), (len(self.skills) + 7) // 8
+            ),
+        }
+        for field, values in self._contacts.items():
+            sections[f'{field}_offsets'], sections[f'{field}_data'] = _string_column(values)
+        # Tokens never contain whitespace, so terms are newline separated
+        sections['terms'] = np.frombuffer('\n'.join(self.vocabulary.terms).encode('utf-8'),
+                                          dtype=np.uint8)
+
+        layout = {}
+        position = 0
+        for section, array in sections.items():
+            layout[section] = {
+                'offset': position,
+                'dtype': array.dtype.str,
+                'shape': array.shape
+            }
+            position = _aligned(position + array.nbytes)
+
+        header = json.dumps({
+            'version': FORMAT_VERSION,
+            'documents': len(documents),
+            'tokenizer': self.analyzer.tokenizer,
+            'config_version': self.analyzer.CONFIG_VERSION,
+            'skills': self.skills,
+            'sections': layout
+        }).encode('utf-8')
+
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(np.uint64(len(header)).tobytes())
+            f.write(header)
+            f.write(b'\0' * (_aligned(f.tell()) - f.tell()))
+            data_start = f.tell()
+            for section, array in sections.items():
+                f.write(b'\0' * (data_start + layout[section]['offset'] - f.tell()))
+                f.write(array.tobytes())
+        os.replace(temp_path, path)
+
+
+class CorpusStore:
+    """Read-only, memory-mapped view of a file written by CorpusWriter
+
+    Arrays are numpy views straight onto the mapped file, so opening is
+    cheap and processes that open the same file share its pages. Ranking
+    a job description only tokenizes the job; no PDF is parsed again.
+    """
+
+    def __init__(self, path, analyzer=None):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a corpus store file")
+        header_length = int(np.frombuffer(self._mmap, dtype=np.uint64, count=1,
+                                          offset=len(MAGIC))[0])
+        header_start = len(MAGIC) + 8
+        self.header = json.loads(self._mmap[header_start:header_start + header_length])
+        if self.header['version'] != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported corpus store version {self.header['version']}")
+
+        data_start = _aligned(header_start + header_length)
+        self._sections = {}
+        for section, spec in self.header['sections'].items():
+            dtype = np.dtype(spec['dtype'])
+            shape = tuple(spec['shape'])
+            count = int(np.prod(shape, dtype=np.int64))
+            self._sections[section] = np.frombuffer(
+                self._mmap, dtype=dtype, count=count, offset=data_start + spec['offset']
+            ).reshape(shape)
+
+        self.doc_offsets = self._sections['doc_offsets']
+        self.term_ids = self._sections['term_ids']
+        self.counts = self._sections['counts']
+        self.first_seen = self._sections['first_seen']
+        self.skill_bits = self._sections['skill_bits']
+        self.skills = [tuple(pair) for pair in self.header['skills']]
+
+        self.analyzer = analyzer or ResumeAnalyzer(tokenizer=self.header['tokenizer'])
+        self._vocabulary = None
+
+    def __reduce__(self):
+        # Worker processes reopen the file and map the same pages
+        return self.__class__, (self.path,)
+
+    def __len__(self):
+        return self.header['documents']
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmap the file; views returned earlier must be released first"""
+        self._sections = self.doc_offsets = self.term_ids = self.counts = None
+        self.first_seen = None
+        self.skill_bits = None
+        self._mmap.close()
+
+    @property
+    def vocabulary(self):
+        """The corpus Vocabulary, built from the file on first use"""
+        if self._vocabulary is None:
+            terms = self._sections['terms'].tobytes().decode('utf-8')
+            self._vocabulary = Vocabulary(terms.split('\n') if terms else ())
+        return self._vocabulary
+
+    def document(self, index):
+        """Zero-copy EncodedDocument for one resume"""
+        start, end = self.doc_offsets[index], self.doc_offsets[index + 1]
+        return EncodedDocument(self.vocabulary, self.term_ids[start:end], self.counts[start:end],
+                               self.first_seen[start:end])
+
+    def record(self, index):
+        """Contact fields and skills of one resume"""
+        record = {field: self._string(field, index) or None for field in CONTACT_FIELDS}
+        bits = np.unpackbits(self.skill_bits[index], count=len(self.skills))
+        skills = {}
+        for bit in np.flatnonzero(bits).tolist():
+            category, skill = self.skills[bit]
+            skills.setdefault(category, []).append(skill)
+        record['skills'] = skills
+        return record
+
+    def score(self, job_description, top_k=10):
+        """Rank every stored resume by the share of job keywords it contains
+
+        job_description may be text or a prebuilt JobProfile. Percentages
+        use the same definition as ResumeAnalyzer.calculate_job_match.
+        """
+        if not isinstance(job_description, AnalyzedDocument):
+            job_description = self.analyzer.build_job_profile(job_description)
+        job_terms = job_description.token_set
+        if not job_terms or not len(self):
+            return []
+
+        # Job terms the corpus never saw cannot match but still count as missing
+        vocabulary = self.vocabulary
+        job_ids = np.array(
+            [vocabulary.id_of(term) for term in job_terms if term in vocabulary],
+            dtype=np.uint32
+        )
+        in_job = np.zeros(len(vocabulary), dtype=np.bool_)
+        in_job[job_ids] = True
+
+        # Distinct job terms per resume: running total of hits between offsets
+        hits = np.zeros(len(self.term_ids) + 1, dtype=np.int64)
+        np.cumsum(in_job[self.term_ids], out=hits[1:])
+        hits = hits[self.doc_offsets[1:]] - hits[self.doc_offsets[:-1]]
+
+        ranked = np.argsort(-hits, kind='stable')[:top_k]
+
+        job_skills = getattr(job_description, 'skill_set', set())
+        matches = []
+        for index in ranked.tolist():
+            resume_terms = set(vocabulary.decode(
+                self.term_ids[self.doc_offsets[index]:self.doc_offsets[index + 1]]
+            ))
+            record = self.record(index)
+            resume_skills = {skill for found in record['skills'].values() for skill in found}
+            matching = job_terms & resume_terms
+            matches.append({
+                'name': record['name'],
+                'email': record['email'],
+                'percentage': (int(hits[index]) / len(job_terms)) * 100,
+                'matching_keywords': matching,
+                'missing_keywords': job_terms - matching,
+                'matched_skills': sorted(resume_skills & job_skills)
+            })
+        return matches
+
+    def _string(self, field, index):
+        offsets = self._sections[f'{field}_offsets']
+        data = self._sections[f'{field}_data']
+        return data[offsets[index]:offsets[index + 1]].tobytes().decode('utf-8')
+
+
+def _aligned(position):
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+def _string_column(values):
+    """UTF-8 blob of values plus uint64 byte offsets (len n + 1)"""
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    np.cumsum(np.array([len(value) for value in encoded], dtype=np.uint64), out=offsets[1:])
+    return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)
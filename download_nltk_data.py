@@ -1,7 +1,27 @@
 import nltk
 
-print("Downloading NLTK data...")
-nltk.download('punkt')
-nltk.download('stopwords')
-nltk.download('punkt_tab')
-print("Download complete!")
\ No newline at end of file
+# NLTK resources used by ResumeAnalyzer: (lookup path, download name)
+RESOURCES = [
+    ('tokenizers/punkt', 'punkt'),
+    ('corpora/stopwords', 'stopwords'),
+    ('tokenizers/punkt_tab', 'punkt_tab')
+]
+
+
+def download_nltk_data(quiet=True):
+    """Download required NLTK data if not present
+
+    Safe to run repeatedly: resources already installed are skipped.
+    """
+    for resource_path, resource_name in RESOURCES:
+        try:
+            nltk.data.find(resource_path)
+        except LookupError:
+            print(f"Downloading {resource_name}...")
+            nltk.download(resource_name, quiet=quiet)
+
+
+if __name__ == '__main__':
+    print("Downloading NLTK data...")
+    download_nltk_data(quiet=False)
+    print("Download complete!")
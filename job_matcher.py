@@ -0,0 +1,128 @@
+import numpy as np
+from scipy import sparse
+
+from resume_analyzer import AnalyzedDocument
+
+
+class TfidfMatcher:
+    """Rank a corpus of resumes against job descriptions with sparse TF-IDF
+
+    The resume matrix is built once by fit(); score() then ranks every
+    resume against one or many job descriptions with a single sparse
+    matrix product.
+    """
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.resume_ids = []
+        self.vocabulary = {}
+        self.terms = []
+        self.idf = None
+        # Resumes x terms: L2-normalised TF-IDF weights and term presence
+        self.weights = None
+        self.presence = None
+
+    def fit(self, resumes):
+        """Index (resume_id, text or AnalyzedDocument) pairs"""
+        rows, cols, counts = [], [], []
+        self.resume_ids = []
+        self.vocabulary = {}
+
+        for row, (resume_id, resume) in enumerate(resumes):
+            document = self._document(resume)
+            self.resume_ids.append(resume_id)
+            for term, count in document.token_counts.items():
+                rows.append(row)
+                cols.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                counts.append(count)
+
+        self.terms = list(self.vocabulary)
+        shape = (len(self.resume_ids), len(self.terms))
+        tf = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float32), (rows, cols)), shape=shape
+        )
+
+        # Smoothed inverse document frequency
+        df = np.bincount(tf.indices, minlength=shape[1])
+        self.idf = (np.log((1 + shape[0]) / (1 + df)) + 1).astype(np.float32)
+
+        self.presence = tf.copy()
+        self.presence.data[:] = 1
+        self.weights = self._normalize(self._sublinear(tf).multiply(self.idf).tocsr())
+        return self
+
+    def score(self, job_descriptions, top_k=10):
+        """Return the top_k resumes for each job description
+
+        Job descriptions may be texts or prebuilt JobProfiles. Each match
+        holds the resume id, the cosine similarity score, the keyword match
+        percentage used by calculate_job_match, and the matching and
+        missing keywords.
+        """
+        if isinstance(job_descriptions, (str, AnalyzedDocument)):
+            job_descriptions = [job_descriptions]
+        job_terms = [self._document(job).token_set for job in job_descriptions]
+        query = self._query_matrix(job_terms)
+
+        # Resumes x jobs cosine similarity in one sparse product
+        scores = (self.weights @ self._normalize(query.multiply(self.idf).tocsr()).T).toarray()
+
+        rankings = []
+        for column, terms in enumerate(job_terms):
+            top = self._top_rows(scores[:, column], top_k)
+            rankings.append([
+                self._match(row, terms, scores[row, column])
+                for row in top
+            ])
+        return rankings
+
+    def _document(self, text):
+        if isinstance(text, AnalyzedDocument):
+            return text
+        return self.analyzer.prepare_document(text)
+
+    def _query_matrix(self, job_terms):
+        """Binary jobs x terms matrix over the resume vocabulary"""
+        rows, cols = [], []
+        for row, terms in enumerate(job_terms):
+            for term in terms:
+                col = self.vocabulary.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(job_terms), len(self.terms))
+        )
+
+    def _match(self, row, job_terms, score):
+        start, end = self.presence.indptr[row], self.presence.indptr[row + 1]
+        resume_terms = {self.terms[col] for col in self.presence.indices[start:end]}
+        matching = job_terms & resume_terms
+        percentage = (len(matching) / len(job_terms)) * 100 if job_terms else 0
+        return {
+            'resume_id': self.resume_ids[row],
+            'score': float(score),
+            'percentage': percentage,
+            'matching_keywords': matching,
+            'missing_keywords': job_terms - matching
+        }
+
+    @staticmethod
+    def _top_rows(column, top_k):
+        if top_k >= len(column):
+            return np.argsort(-column, kind='stable')
+        top = np.argpartition(-column, top_k)[:top_k]
+        return top[np.argsort(-column[top], kind='stable')]
+
+    @staticmethod
+    def _sublinear(matrix):
+        matrix = matrix.copy()
+        matrix.data = 1 + np.log(matrix.data)
+        return matrix
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms) @ matrix
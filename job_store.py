@@ -0,0 +1,104 @@
+import heapq
+import json
+from collections import Counter
+
+
+class JobStore:
+    """Preprocessed job descriptions kept for matching many resumes
+
+    Each posting is turned into a JobProfile once when added. An inverted
+    term -> jobs map lets match() score a resume against every posting in
+    a single pass over the resume's terms.
+    """
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.jobs = {}
+        self._postings = {}
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def add(self, job_id, description, title=None):
+        """Store one job description, given as text or a JobProfile"""
+        if isinstance(description, str):
+            profile = self.analyzer.build_job_profile(description, job_id, title)
+        else:
+            profile = description
+
+        if job_id in self.jobs:
+            self.remove(job_id)
+
+        self.jobs[job_id] = profile
+        for term in profile.token_set:
+            self._postings.setdefault(term, set()).add(job_id)
+
+    def remove(self, job_id):
+        """Drop a job description from the store"""
+        profile = self.jobs.pop(job_id)
+        for term in profile.token_set:
+            job_ids = self._postings[term]
+            job_ids.discard(job_id)
+            if not job_ids:
+                del self._postings[term]
+
+    def load(self, path):
+        """Add jobs from a JSON Lines file
+
+        Lines are either raw postings ({"id", "title", "description"}) or
+        profiles written by save(), which skip preprocessing.
+        """
+        from resume_analyzer import JobProfile
+
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                job = json.loads(line)
+                if 'cleaned_text' in job:
+                    profile = JobProfile.from_dict(job)
+                    self.add(profile.job_id, profile)
+                else:
+                    self.add(job['id'], job['description'], job.get('title'))
+        return self
+
+    def save(self, path):
+        """Write every preprocessed profile to a JSON Lines file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for job_id, profile in self.jobs.items():
+                data = profile.to_dict()
+                data['job_id'] = job_id
+                f.write(json.dumps(data) + '\n')
+
+    def match(self, resume, top_k=10):
+        """Rank stored jobs by the share of their keywords found in the resume
+
+        resume may be text or an AnalyzedDocument. Percentages use the same
+        definition as ResumeAnalyzer.calculate_job_match.
+        """
+        if isinstance(resume, str):
+            resume = self.analyzer.prepare_document(resume)
+        resume_terms = resume.token_set
+
+        # Count shared keywords for every job at once via the postings
+        hits = Counter()
+        for term in resume_terms:
+            hits.update(self._postings.get(term, ()))
+
+        def percentage(job_id):
+            terms = self.jobs[job_id].token_set
+            return (hits[job_id] / len(terms)) * 100 if terms else 0
+
+        ranked = heapq.nlargest(top_k, self.jobs, key=percentage)
+        matches = []
+        for job_id in ranked:
+            profile = self.jobs[job_id]
+            matching = profile.token_set & resume_terms
+            matches.append({
+                'job_id': job_id,
+                'title': profile.title or job_id,
+                'percentage': percentage(job_id),
+                'matching_keywords': matching,
+                'missing_keywords': profile.token_set - matching
+            })
+        return matches
@@ -0,0 +1,70 @@
+import threading
+from bisect import bisect_left
+
+
+class StageMetrics:
+    """Prometheus-style counters and histograms for analysis stage timings
+
+    Pass an instance as ResumeAnalyzer(metrics_hook=...); it is called with
+    (stage, wall_seconds, cpu_seconds) after every timed stage.
+    """
+
+    # Upper bounds in seconds, as in Prometheus client defaults
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets=None):
+        self.buckets = tuple(buckets or self.BUCKETS)
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, stage, wall, cpu):
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = {
+                    'count': 0,
+                    'wall_sum': 0.0,
+                    'cpu_sum': 0.0,
+                    'bucket_counts': [0] * (len(self.buckets) + 1)
+                }
+            stats['count'] += 1
+            stats['wall_sum'] += wall
+            stats['cpu_sum'] += cpu
+            stats['bucket_counts'][bisect_left(self.buckets, wall)] += 1
+
+    def snapshot(self):
+        """Copy of the per-stage counters"""
+        with self._lock:
+            return {
+                stage: dict(stats, bucket_counts=list(stats['bucket_counts']))
+                for stage, stats in self._stages.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def render_prometheus(self, prefix='resume_analyzer'):
+        """Text exposition format for a Prometheus scrape endpoint"""
+        lines = [
+            f'# HELP {prefix}_stage_seconds Wall time per analysis stage.',
+            f'# TYPE {prefix}_stage_seconds histogram',
+        ]
+        snapshot = self.snapshot()
+        for stage, stats in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, stats['bucket_counts']):
+                cumulative += count
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} '
+                             f'{cumulative}')
+            lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} '
+                         f'{stats["count"]}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {stats["wall_sum"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+
+        lines.append(f'# HELP {prefix}_stage_cpu_seconds_total CPU time per analysis stage.')
+        lines.append(f'# TYPE {prefix}_stage_cpu_seconds_total counter')
+        for stage, stats in sorted(snapshot.items()):
+            lines.append(f'{prefix}_stage_cpu_seconds_total{{stage="{stage}"}} '
+                         f'{stats["cpu_sum"]}')
+        return '\n'.join(lines) + '\n'
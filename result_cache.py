@@ -0,0 +1,117 @@
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """Analysis results keyed by a hash of the PDF and analysis inputs
+
+    Results live in an in-memory LRU tier and, when db_path is given, in a
+    SQLite file that is trimmed to max_disk_bytes, least recently used
+    first. Entries are stored pickled, so every hit returns a fresh copy
+    that callers are free to modify.
+    """
+
+    def __init__(self, max_items=128, db_path=None, max_disk_bytes=256 * 1024 * 1024):
+        self.max_items = max_items
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'key TEXT PRIMARY KEY, data BLOB, size INTEGER, accessed REAL)'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)'
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(pdf_data, *parts):
+        """Hash the PDF together with everything that shapes the result
+
+        pdf_data is the PDF bytes or a binary file, which is read in chunks.
+        """
+        if isinstance(pdf_data, bytes):
+            digest = hashlib.sha256(pdf_data)
+        else:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: pdf_data.read(1024 * 1024), b''):
+                digest.update(chunk)
+        for part in parts:
+            digest.update(b'\0')
+            digest.update(repr(part).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the cached result for key, or None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    'SELECT data FROM results WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    data = row[0]
+                    self._db.execute(
+                        'UPDATE results SET accessed = ? WHERE key = ?',
+                        (time.time(), key)
+                    )
+                    self._db.commit()
+                    self._remember(key, data)
+
+        if data is None:
+            return None
+        return pickle.loads(data)
+
+    def put(self, key, result):
+        """Store result in every tier"""
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, data)
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO results (key, data, size, accessed) '
+                    'VALUES (?, ?, ?, ?)',
+                    (key, data, len(data), time.time())
+                )
+                self._evict_disk()
+                self._db.commit()
+
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM results')
+                self._db.commit()
+
+    def _remember(self, key, data):
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+
+        # Delete least recently used rows until the store fits
+        rows = self._db.execute('SELECT key, size FROM results ORDER BY accessed')
+        expired = []
+        for key, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            expired.append((key,))
+            total -= size
+        self._db.executemany('DELETE FROM results WHERE key = ?', expired)
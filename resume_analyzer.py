@@ -1,42 +1,209 @@
+import base64
+import json
+import os
 import re
-import fitz  # PyMuPDF
-from collections import Counter
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+try:
+    import pymupdf as fitz  # PyMuPDF
+except ImportError:
+    # PyMuPDF releases before 1.24.3 only provide the fitz name
+    import fitz
+from collections import Counter, namedtuple
 from io import BytesIO
+from itertools import compress
+import numpy as np
+from contact_extractor import ContactExtractor
+from job_store import JobStore
+from skill_matcher import SkillMatcher
+from vocabulary import EncodedDocument
 
 
-# Download required NLTK data
-def download_nltk_data():
-    """Download required NLTK data if not present"""
-    resources = [
-        ('tokenizers/punkt', 'punkt'),
-        ('corpora/stopwords', 'stopwords'),
-        ('tokenizers/punkt_tab', 'punkt_tab')
-    ]
+class ExtractionError(Exception):
+    """Raised when no text can be extracted from a PDF"""
 
-    for resource_path, resource_name in resources:
-        try:
-            nltk.data.find(resource_path)
-        except LookupError:
-            print(f"Downloading {resource_name}...")
-            nltk.download(resource_name, quiet=True)
 
+class StageResult(namedtuple('StageResult', ('stage', 'fields'))):
+    """One finished stage from analyze_resume_iter and the result fields it filled"""
+
+    __slots__ = ()
+
+
+# Analyzer owned by each batch worker process
+_worker_analyzer = None
+
+
+def _init_batch_worker(analyzer_options):
+    """Load stopwords and skill tables once per worker process"""
+    global _worker_analyzer
+    _worker_analyzer = ResumeAnalyzer(**analyzer_options)
+
+
+def _analyze_batch_item(item, job_description, include_wordcloud, token_counts=False):
+    """Analyze one batch item in a worker process"""
+    name, source = _batch_item_source(item)
+    try:
+        result = _worker_analyzer.analyze_resume(
+            source, job_description, include_wordcloud, token_counts=token_counts
+        )
+        return {'file': name, 'status': 'ok', 'result': result, 'error': None}
+    except ExtractionError as e:
+        return {'file': name, 'status': 'extraction_error', 'result': None, 'error': str(e)}
+    except Exception as e:
+        return {'file': name, 'status': 'error', 'result': None, 'error': str(e)}
+
+
+def _batch_item_source(item):
+    """Split a batch item into a display name and a path or PDF bytes"""
+    if isinstance(item, tuple):
+        return item
+    return str(item), item
+
+
+def results_to_json(results, include_wordcloud=False):
+    """Convert analyze_resume results into JSON-serializable data
+
+    Keyword sets become sorted lists. The word cloud is dropped unless
+    include_wordcloud is set, in which case it is base64 encoded.
+    """
+    data = dict(results)
+    job_match = data.get('job_match')
+    if job_match:
+        data['job_match'] = {
+            'percentage': job_match['percentage'],
+            'matching_keywords': sorted(job_match['matching_keywords']),
+            'missing_keywords': sorted(job_match['missing_keywords'])
+        }
+
+    wordcloud = data.pop('wordcloud', None)
+    if include_wordcloud and wordcloud is not None:
+        data['wordcloud'] = base64.b64encode(wordcloud.getvalue()).decode('ascii')
+    return data
+
+
+class AnalyzedDocument:
+    """Text preprocessed once and shared by every analysis stage"""
+
+    def __init__(self, cleaned_text, tokens, filtered_tokens):
+        self.cleaned_text = cleaned_text
+        self.tokens = tokens
+        # Tokens without stopwords and short words
+        self.filtered_tokens = filtered_tokens
+        self.token_counts = Counter(filtered_tokens)
+        self.token_set = set(self.token_counts)
 
-# Download NLTK data
-download_nltk_data()
+
+class JobProfile(AnalyzedDocument):
+    """Job description preprocessed once and reused for every resume
+
+    Accepted anywhere a job description is, and saved to or loaded from
+    JSON so a posting is only tokenized once.
+    """
+
+    def __init__(self, cleaned_text, tokens, filtered_tokens, skills,
+                 job_id=None, title=None):
+        super().__init__(cleaned_text, tokens, filtered_tokens)
+        self.job_id = job_id
+        self.title = title
+        self.skills = skills
+        self.skill_set = {skill for found in skills.values() for skill in found}
+
+        # Share of the posting's keywords taken by each term
+        total = len(filtered_tokens)
+        self.term_weights = {
+            term: count / total for term, count in self.token_counts.items()
+        }
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'title': self.title,
+            'cleaned_text': self.cleaned_text,
+            'tokens': self.tokens,
+            'filtered_tokens': self.filtered_tokens,
+            'skills': self.skills
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['cleaned_text'], data['tokens'], data['filtered_tokens'],
+                   data['skills'], data.get('job_id'), data.get('title'))
+
+    def save(self, path):
+        """Write the profile to a JSON file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """Read a profile written by save()"""
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
 
 
 class ResumeAnalyzer:
-    def __init__(self):
+    # Bump when a change alters analysis output, to invalidate cached results
+    CONFIG_VERSION = 4
+
+    # Limits that keep one oversized PDF from stalling a worker
+    MAX_PDF_PAGES = 50
+    MAX_PDF_BYTES = 20 * 1024 * 1024
+
+    # Patterns used by clean_text
+    NON_TEXT_PATTERN = re.compile(r'[^a-zA-Z0-9\s+#.]')
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+
+    # Punkt keeps the period of these abbreviations mid-text instead of
+    # reading it as a sentence end
+    FAST_ABBREVIATIONS = (
+        'e.g', 'i.e', 'u.s', 'a.m', 'p.m', 'etc', 'vs', 'inc', 'corp', 'co', 'ltd',
+        'mr', 'mrs', 'ms', 'dr', 'jr', 'sr', 'jan', 'feb', 'aug', 'sept', 'oct', 'nov', 'dec'
+    )
+    # Fast tokenizer for cleaned text, mirroring NLTK's word_tokenize (a
+    # Punkt sentence split, then Treebank) on what clean_text leaves. A
+    # period before whitespace ends a sentence and is split off, except
+    # after an abbreviation, or after an initial or a number when a
+    # lowercase word follows. Dotted names (".net", "next.js") stay whole;
+    # '#' and runs of dots are split off, and a period right before '#'
+    # stays on its word as in Treebank ("skills.#1" -> "skills.", "#", "1")
+    FAST_TOKEN_PATTERN = re.compile(
+        r'(?:' + '|'.join(map(re.escape, FAST_ABBREVIATIONS)) + r')\.(?=\s+\S)'
+        r'|(?:[a-z]|\.?\d[\d.]*)\.(?=\s+[a-z])'
+        r'|\.?[^\s#.]+(?:\.[^\s#.]+)*(?:\.(?=#))?|\.{2,}|[#.]'
+    )
+    TOKENIZERS = ('nltk', 'fast')
+
+    # Stages yielded by analyze_resume_iter, cheapest first, and the
+    # result fields each one fills
+    STAGES = (
+        ('text', ('text',)),
+        ('contact', ('email', 'phone', 'urls', 'linkedin')),
+        ('skills', ('skills',)),
+        ('frequency', ('word_frequency',)),
+        ('match', ('job_match',)),
+        ('wordcloud', ('wordcloud',)),
+    )
+
+    def __init__(self, cache=None, tokenizer='nltk', metrics_hook=None):
+        # Optional ResultCache for repeated analyses of the same upload
+        self.cache = cache
+        # Optional callable(stage, wall_seconds, cpu_seconds) for each stage
+        # analyze_resume runs, e.g. a metrics.StageMetrics instance
+        self.metrics_hook = metrics_hook
+
+        if tokenizer not in self.TOKENIZERS:
+            raise ValueError(f"Unknown tokenizer: {tokenizer}")
+        self.tokenizer = tokenizer
+
         try:
+            # NLTK is imported lazily so importing this module does no I/O
+            from nltk.corpus import stopwords
             self.stop_words = set(stopwords.words('english'))
-        except LookupError:
+        except (ImportError, LookupError):
             # Fallback: use basic stopwords if NLTK data not available
-            print("Warning: NLTK stopwords not found. Using basic stopwords.")
+            print("Warning: NLTK stopwords not found. Using basic stopwords.",
+                  file=sys.stderr)
             self.stop_words = set([
                 'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you',
                 'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself',
@@ -68,131 +235,192 @@ class ResumeAnalyzer:
                             'analytical', 'creative', 'management', 'agile', 'scrum']
         }
 
-    def extract_text_from_pdf(self, pdf_file):
-        """Extract text from PDF file"""
+        # Compile all skills into one automaton for single-pass matching
+        self.skill_matcher = SkillMatcher(self.skill_keywords)
+        self.contact_extractor = ContactExtractor()
+
+    def iter_pdf_pages(self, pdf_file, max_pages=None, max_bytes=None):
+        """Yield the text of each PDF page as it is decoded
+
+        pdf_file may be a path, raw bytes or a file-like object. Documents
+        larger than max_bytes are rejected and pages past max_pages are
+        ignored; both default to the class limits.
+        """
+        if max_pages is None:
+            max_pages = self.MAX_PDF_PAGES
+        if max_bytes is None:
+            max_bytes = self.MAX_PDF_BYTES
+
+        if isinstance(pdf_file, (str, os.PathLike)):
+            # Let PyMuPDF read the file itself instead of copying it
+            if os.path.getsize(pdf_file) > max_bytes:
+                raise ValueError(f"PDF is larger than {max_bytes} bytes")
+            doc = fitz.open(pdf_file, filetype="pdf")
+        else:
+            if isinstance(pdf_file, bytes):
+                data = pdf_file
+            else:
+                data = pdf_file.read(max_bytes + 1)
+            if len(data) > max_bytes:
+                raise ValueError(f"PDF is larger than {max_bytes} bytes")
+            doc = fitz.open(stream=data, filetype="pdf")
+
+        with doc:
+            for page_number, page in enumerate(doc):
+                if page_number >= max_pages:
+                    break
+                yield page.get_text()
+
+    def extract_text_from_pdf(self, pdf_file, max_pages=None, max_bytes=None):
+        """Extract text from PDF file
+
+        Raises ExtractionError if the PDF cannot be read or has no text.
+        """
         try:
-            doc = fitz.open(stream=pdf_file.read(), filetype="pdf")
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            return text
+            text = ''.join(self.iter_pdf_pages(pdf_file, max_pages, max_bytes))
         except Exception as e:
-            return f"Error extracting text: {str(e)}"
+            raise ExtractionError(f"Error extracting text: {str(e)}") from e
+
+        if not text.strip():
+            raise ExtractionError("Error extracting text: no text found in PDF")
+        return text
 
     def clean_text(self, text):
         """Clean and preprocess text"""
         # Convert to lowercase
         text = text.lower()
         # Remove special characters and extra spaces
-        text = re.sub(r'[^a-zA-Z0-9\s+#.]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = self.NON_TEXT_PATTERN.sub(' ', text)
+        text = self.WHITESPACE_PATTERN.sub(' ', text)
         return text.strip()
 
+    def tokenize(self, cleaned_text):
+        """Split cleaned text into tokens"""
+        if self.tokenizer == 'fast':
+            return self.FAST_TOKEN_PATTERN.findall(cleaned_text)
+
+        try:
+            from nltk.tokenize import word_tokenize
+            return word_tokenize(cleaned_text)
+        except (ImportError, LookupError):
+            # Fallback tokenization if NLTK punkt not available
+            return cleaned_text.split()
+
+    def prepare_document(self, text):
+        """Clean, tokenize and filter text once for all analysis stages"""
+        cleaned_text = self.clean_text(text)
+        tokens = self.tokenize(cleaned_text)
+        filtered_tokens = [
+            word for word in tokens
+            if word not in self.stop_words and len(word) > 2
+        ]
+        return AnalyzedDocument(cleaned_text, tokens, filtered_tokens)
+
+    def build_job_profile(self, job_description, job_id=None, title=None):
+        """Preprocess a job description once for matching many resumes"""
+        document = self.prepare_document(job_description)
+        return JobProfile(document.cleaned_text, document.tokens,
+                          document.filtered_tokens, self.extract_skills(job_description),
+                          job_id, title)
+
+    def encode_document(self, text, vocabulary):
+        """Preprocess text into id-based sparse counts over a shared Vocabulary"""
+        return vocabulary.encode_document(self.prepare_document(text))
+
     def extract_email(self, text):
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else "Not found"
+        return self.contact_extractor.extract_email(text)
 
     def extract_phone(self, text):
         """Extract phone number"""
-        phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text)
-        return phones[0] if phones else "Not found"
+        return self.contact_extractor.extract_phone(text)
+
+    def extract_contact_info(self, text):
+        """Extract email, phone, URLs and LinkedIn handle in one pass"""
+        return self.contact_extractor.extract(text)
 
     def extract_skills(self, text):
         """Extract skills from resume"""
-        text_lower = text.lower()
-        found_skills = {}
-
-        for category, skills in self.skill_keywords.items():
-            found = []
-            for skill in skills:
-                # Look for whole word matches
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found.append(skill)
-            if found:
-                found_skills[category] = found
-
-        return found_skills
-
-    def get_word_frequency(self, text, top_n=20):
-        """Get most frequent words"""
-        cleaned_text = self.clean_text(text)
+        return self.skill_matcher.extract(text)
 
-        try:
-            tokens = word_tokenize(cleaned_text)
-        except LookupError:
-            # Fallback tokenization if NLTK punkt not available
-            tokens = cleaned_text.split()
+    def get_word_frequency(self, text, top_n=20, document=None):
+        """Get most frequent words
 
-        # Filter tokens
-        filtered_tokens = [
-            word for word in tokens
-            if word not in self.stop_words
-               and len(word) > 2
-               and word.isalpha()
-        ]
+        document may be an AnalyzedDocument or, for large corpora, an
+        EncodedDocument counted by term id.
+        """
+        if isinstance(document, EncodedDocument):
+            return document.most_common(top_n, alpha_only=True)
 
-        # Get frequency
-        word_freq = Counter(filtered_tokens)
+        if document is None:
+            document = self.prepare_document(text)
+
+        # Keep alphabetic words only
+        word_freq = Counter({
+            word: count for word, count in document.token_counts.items()
+            if word.isalpha()
+        })
         return dict(word_freq.most_common(top_n))
 
-    def generate_wordcloud(self, text):
-        """Generate word cloud image"""
-        cleaned_text = self.clean_text(text)
+    def generate_wordcloud(self, text, document=None, image_format='PNG',
+                           width=800, height=400, quality=None):
+        """Generate word cloud image
 
-        # Remove stopwords
-        try:
-            tokens = word_tokenize(cleaned_text)
-        except LookupError:
-            tokens = cleaned_text.split()
+        image_format is PNG, WEBP or JPEG. quality is the compression level
+        (0-9) for PNG and the quality (1-100) for WEBP and JPEG.
+        """
+        from wordcloud import WordCloud
 
-        filtered_text = ' '.join([
-            word for word in tokens
-            if word not in self.stop_words and len(word) > 2
-        ])
+        if document is None:
+            document = self.prepare_document(text)
+
+        filtered_text = ' '.join(document.filtered_tokens)
 
         # Generate word cloud
         wordcloud = WordCloud(
-            width=800,
-            height=400,
+            width=width,
+            height=height,
             background_color='white',
             colormap='viridis',
             max_words=100
         ).generate(filtered_text)
 
-        # Create plot
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-        plt.tight_layout(pad=0)
+        # Encode the PIL image directly, without a matplotlib figure
+        image_format = image_format.upper()
+        if image_format == 'JPG':
+            image_format = 'JPEG'
+        save_options = {}
+        if quality is not None:
+            if image_format == 'PNG':
+                save_options['compress_level'] = quality
+            else:
+                save_options['quality'] = quality
 
-        # Save to bytes
         buf = BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+        wordcloud.to_image().save(buf, format=image_format, **save_options)
         buf.seek(0)
-        plt.close()
 
         return buf
 
-    def calculate_job_match(self, resume_text, job_description):
-        """Calculate match percentage between resume and job description"""
-        resume_clean = self.clean_text(resume_text)
-        job_clean = self.clean_text(job_description)
+    def calculate_job_match(self, resume_text, job_description, document=None):
+        """Calculate match percentage between resume and job description
 
-        # Tokenize
-        try:
-            resume_tokens = set(word_tokenize(resume_clean))
-            job_tokens = set(word_tokenize(job_clean))
-        except LookupError:
-            resume_tokens = set(resume_clean.split())
-            job_tokens = set(job_clean.split())
+        job_description may be text or a JobProfile (or any
+        AnalyzedDocument) built once and reused across many resumes.
+        Either side may instead be an EncodedDocument, which matches by
+        term id over its Vocabulary.
+        """
+        if isinstance(document, EncodedDocument) or isinstance(job_description, EncodedDocument):
+            return self._match_encoded(resume_text, job_description, document)
+
+        if document is None:
+            document = self.prepare_document(resume_text)
+
+        if not isinstance(job_description, AnalyzedDocument):
+            job_description = self.prepare_document(job_description)
 
-        # Remove stopwords
-        resume_tokens = {w for w in resume_tokens if w not in self.stop_words and len(w) > 2}
-        job_tokens = {w for w in job_tokens if w not in self.stop_words and len(w) > 2}
+        resume_tokens = document.token_set
+        job_tokens = job_description.token_set
 
         # Calculate match
         if not job_tokens:
@@ -205,40 +433,302 @@ class ResumeAnalyzer:
 
         return match_percentage, matching_keywords, missing_keywords
 
-    def analyze_resume(self, pdf_file, job_description=None):
-        """Complete resume analysis"""
+    def _match_encoded(self, resume_text, job_description, document):
+        """calculate_job_match over term ids of one shared Vocabulary"""
+        if isinstance(job_description, EncodedDocument):
+            vocabulary = job_description.vocabulary
+        else:
+            vocabulary = document.vocabulary
+            if not isinstance(job_description, AnalyzedDocument):
+                job_description = self.prepare_document(job_description)
+            # grow=False keeps one-off job terms out of the shared vocabulary
+            job_description = vocabulary.encode_document(job_description, grow=False)
+        # Job terms the vocabulary never saw cannot match but still count as missing
+        unknown_terms = job_description.unknown_terms
+
+        if document is None:
+            document = self.prepare_document(resume_text)
+        if not isinstance(document, EncodedDocument):
+            # Terms outside the vocabulary cannot match the job anyway
+            document = vocabulary.encode_document(document, grow=False)
+        elif document.vocabulary is not vocabulary:
+            raise ValueError("Resume and job description use different vocabularies")
+
+        job_ids = job_description.term_ids
+        job_size = len(job_ids) + len(unknown_terms)
+        if not job_size:
+            return 0, set(), set()
+
+        # Both id arrays are sorted, so binary search the resume's ids; the
+        # cost follows the document sizes rather than the vocabulary size
+        resume_ids = document.term_ids
+        positions = np.searchsorted(resume_ids, job_ids)
+        inside = positions < len(resume_ids)
+        found = np.zeros(len(job_ids), dtype=np.bool_)
+        found[inside] = resume_ids[positions[inside]] == job_ids[inside]
+
+        # The job's decoded terms are kept on it, so reusing it skips decoding
+        job_terms = job_description.terms
+        matching_keywords = set(compress(job_terms, found.tolist()))
+        missing_keywords = set(compress(job_terms, (~found).tolist())) | unknown_terms
+
+        match_percentage = (len(matching_keywords) / job_size) * 100
+
+        return match_percentage, matching_keywords, missing_keywords
+
+    def match_jobs(self, resume, job_descriptions, top_k=10):
+        """Rank job descriptions by how well one resume matches them
+
+        resume may be text or an AnalyzedDocument and is tokenized once.
+        job_descriptions is a JobStore, reusable across calls, or a dict
+        or list of job description texts or JobProfiles.
+        """
+        if not isinstance(job_descriptions, JobStore):
+            store = JobStore(self)
+            if isinstance(job_descriptions, dict):
+                items = job_descriptions.items()
+            else:
+                items = enumerate(job_descriptions)
+            for job_id, description in items:
+                store.add(job_id, description)
+            job_descriptions = store
+
+        return job_descriptions.match(resume, top_k)
+
+    def analyze_resume(self, pdf_file, job_description=None, include_wordcloud=True,
+                       timings=False, token_counts=False):
+        """Complete resume analysis
+
+        pdf_file may be an uploaded file object, raw PDF bytes or a path.
+
+        The word cloud is the slowest stage; pass include_wordcloud=False to
+        skip it and render it later with generate_wordcloud if needed.
+
+        With timings=True the result gains a 'timings' field mapping each
+        stage to its wall and CPU seconds. Stages are only timed when
+        timings are requested or a metrics_hook is set.
+
+        With token_counts=True the result also holds 'token_counts', the
+        Counter of filtered tokens, so indexes can be built without
+        tokenizing the text again.
+        """
+        stage_times = {} if timings or self.metrics_hook else None
+        documents = [] if token_counts else None
+
+        results = {}
+        for result in self._iter_analysis(pdf_file, job_description, include_wordcloud,
+                                          stage_times, documents):
+            results.update(result.fields)
+
+        if timings:
+            results['timings'] = stage_times
+        if token_counts:
+            # Cache hits skip the stages, so tokenize the cached text instead
+            document = documents[0] if documents else self.prepare_document(results['text'])
+            results['token_counts'] = document.token_counts
+        return results
+
+    def analyze_resume_iter(self, pdf_file, job_description=None, include_wordcloud=True):
+        """Yield partial results of analyze_resume, cheapest first
+
+        Each item is a StageResult with .stage and .fields. Stages come in
+        the order of STAGES: text, contact, skills, frequency, match,
+        wordcloud. Merging every fields dict gives the analyze_resume result. Stop iterating (or call close()) to skip
+        the remaining stages.
+        """
+        stage_times = {} if self.metrics_hook else None
+        return self._iter_analysis(pdf_file, job_description, include_wordcloud, stage_times)
+
+    def _iter_analysis(self, pdf_file, job_description, include_wordcloud, stage_times,
+                       documents=None):
+        """Run the analysis stages, through the result cache when one is set"""
+        if self.cache is None:
+            yield from self._analyze_stages(pdf_file, job_description, include_wordcloud,
+                                            stage_times, documents)
+            return
+
+        job_key = job_description
+        if isinstance(job_description, AnalyzedDocument):
+            job_key = job_description.cleaned_text
+        key_parts = (job_key, include_wordcloud, self.CONFIG_VERSION, self.tokenizer)
+
+        # Serve repeat uploads from the cache without parsing the PDF;
+        # oversized input is rejected before it is hashed
+        max_bytes = self.MAX_PDF_BYTES
+        try:
+            if isinstance(pdf_file, (str, os.PathLike)):
+                if os.path.getsize(pdf_file) > max_bytes:
+                    raise ValueError(f"PDF is larger than {max_bytes} bytes")
+                # Hash the file in chunks; PyMuPDF still opens the path itself
+                with open(pdf_file, 'rb') as f:
+                    key = self.cache.make_key(f, *key_parts)
+                source = pdf_file
+            else:
+                source = pdf_file
+                if not isinstance(pdf_file, bytes):
+                    source = pdf_file.read(max_bytes + 1)
+                if len(source) > max_bytes:
+                    raise ValueError(f"PDF is larger than {max_bytes} bytes")
+                key = self.cache.make_key(source, *key_parts)
+        except (OSError, ValueError) as e:
+            raise ExtractionError(f"Error extracting text: {str(e)}") from e
+
+        cached = self._timed(stage_times, 'cache', self.cache.get, key)
+        if cached is not None:
+            for stage, field_names in self.STAGES:
+                yield StageResult(stage, {name: cached[name] for name in field_names})
+            return
+
+        results = {}
+        last_stage = self.STAGES[-1][0]
+        for result in self._analyze_stages(source, job_description,
+                                           include_wordcloud, stage_times, documents):
+            results.update(result.fields)
+            # Cache before the final yield so a caller that stops there still fills it
+            if result.stage == last_stage:
+                self.cache.put(key, results)
+            yield result
+
+    def _timed(self, stage_times, stage, func, *args, **kwargs):
+        """Call func, recording its wall and CPU time when timing is on
+
+        CPU time is the calling thread's own, so stages running concurrently
+        in other threads (e.g. the app's background executor) are not counted.
+        """
+        if stage_times is None:
+            return func(*args, **kwargs)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        result = func(*args, **kwargs)
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+
+        stage_times[stage] = {'wall': wall, 'cpu': cpu}
+        if self.metrics_hook is not None:
+            self.metrics_hook(stage, wall, cpu)
+        return result
+
+    def _analyze_stages(self, pdf_file, job_description, include_wordcloud, stage_times=None,
+                        documents=None):
+        """Run every analysis stage on an uploaded PDF, yielding each as it finishes
+
+        When documents is a list, the prepared AnalyzedDocument is appended to it.
+        """
         # Extract text
-        text = self.extract_text_from_pdf(pdf_file)
+        text = self._timed(stage_times, 'extract', self.extract_text_from_pdf, pdf_file)
+        yield StageResult('text', {'text': text})
 
         # Basic info
-        email = self.extract_email(text)
-        phone = self.extract_phone(text)
+        contact = self._timed(stage_times, 'contact', self.extract_contact_info, text)
+        yield StageResult('contact', contact)
 
         # Skills
-        skills = self.extract_skills(text)
+        skills = self._timed(stage_times, 'skills', self.extract_skills, text)
+        yield StageResult('skills', {'skills': skills})
 
-        # Word frequency
-        word_freq = self.get_word_frequency(text)
+        # Clean and tokenize once for the remaining stages
+        document = self._timed(stage_times, 'tokenize', self.prepare_document, text)
+        if documents is not None:
+            documents.append(document)
 
-        # Word cloud
-        wordcloud_img = self.generate_wordcloud(text)
+        # Word frequency
+        word_freq = self._timed(stage_times, 'frequency', self.get_word_frequency,
+                                text, document=document)
+        yield StageResult('frequency', {'word_frequency': word_freq})
 
         # Job match (if provided)
         job_match_data = None
         if job_description:
-            match_pct, matching, missing = self.calculate_job_match(text, job_description)
+            match_pct, matching, missing = self._timed(
+                stage_times, 'match', self.calculate_job_match,
+                text, job_description, document=document
+            )
             job_match_data = {
                 'percentage': match_pct,
                 'matching_keywords': matching,
                 'missing_keywords': missing
             }
+        yield StageResult('match', {'job_match': job_match_data})
+
+        # Word cloud (optional), the slowest stage
+        wordcloud_img = None
+        if include_wordcloud:
+            wordcloud_img = self._timed(stage_times, 'wordcloud', self.generate_wordcloud,
+                                        text, document=document)
+        yield StageResult('wordcloud', {'wordcloud': wordcloud_img})
+
+    def batch_executor(self, workers=None):
+        """Process pool for analyze_batch whose workers mirror this analyzer's settings
+
+        Create it once and pass it to analyze_batch to reuse the worker
+        processes across batches; the caller shuts it down.
+        """
+        # Workers build their own analyzer with the same settings
+        analyzer_options = {'tokenizer': self.tokenizer}
+        return ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                   initializer=_init_batch_worker,
+                                   initargs=(analyzer_options,))
+
+    def analyze_batch(self, files, job_description=None, workers=None,
+                      include_wordcloud=False, token_counts=False, executor=None):
+        """Analyze many resumes in parallel, yielding results as they finish
+
+        Each item in files is a path or a (name, pdf_bytes) tuple. Every
+        yielded dict holds the file name, a status ('ok', 'extraction_error'
+        or 'error') and either the analysis result or the error message.
+        token_counts is passed on to analyze_resume in the workers.
+
+        executor may be a pool from batch_executor to reuse; otherwise a
+        pool of `workers` processes is started and shut down for this batch.
+        Either way at most 2 * workers files are in flight.
+        """
+        workers = workers or os.cpu_count() or 1
+
+        # Tokenize the job description once instead of once per resume
+        if job_description and not isinstance(job_description, AnalyzedDocument):
+            job_description = self.build_job_profile(job_description)
+
+        if executor is not None:
+            yield from self._run_batch(executor, files, job_description, workers,
+                                       include_wordcloud, token_counts)
+            return
+        with self.batch_executor(workers) as executor:
+            yield from self._run_batch(executor, files, job_description, workers,
+                                       include_wordcloud, token_counts)
+
+    def _run_batch(self, executor, files, job_description, workers, include_wordcloud,
+                   token_counts):
+        """Feed files to executor, keeping a bounded number in flight"""
+        items = iter(files)
+        pending = {}
+
+        def submit_next():
+            item = next(items, None)
+            if item is not None:
+                name, _ = _batch_item_source(item)
+                future = executor.submit(
+                    _analyze_batch_item, item, job_description, include_wordcloud,
+                    token_counts
+                )
+                pending[future] = name
 
-        return {
-            'text': text,
-            'email': email,
-            'phone': phone,
-            'skills': skills,
-            'word_frequency': word_freq,
-            'wordcloud': wordcloud_img,
-            'job_match': job_match_data
-        }
\ No newline at end of file
+        try:
+            for _ in range(workers * 2):
+                submit_next()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    submit_next()
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        # The worker itself failed, e.g. it was killed
+                        yield {'file': name, 'status': 'error', 'result': None,
+                               'error': str(e)}
+        finally:
+            # A shared pool outlives this batch, so drop work nobody will read
+            for future in pending:
+                future.cancel()
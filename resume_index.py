@@ -0,0 +1,263 @@
+import re
+import sqlite3
+
+from resume_analyzer import AnalyzedDocument, ResumeAnalyzer
+
+
+class QuerySyntaxError(ValueError):
+    """Raised for malformed boolean search queries"""
+
+
+class ResumeIndex:
+    """On-disk inverted index of analyzed resumes
+
+    Stores term -> (resume, term frequency) postings and a skill -> resume
+    index in SQLite, so candidate searches never re-parse a PDF.
+    """
+
+    # Quoted phrases, parentheses and bare terms
+    QUERY_TOKEN_PATTERN = re.compile(r'"([^"]*)"|(\()|(\))|([^\s()"]+)')
+    OPERATORS = ('AND', 'OR', 'NOT')
+
+    def __init__(self, path, analyzer=None):
+        self.analyzer = analyzer or ResumeAnalyzer()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS resumes (
+                id INTEGER PRIMARY KEY,
+                name TEXT UNIQUE NOT NULL,
+                email TEXT,
+                phone TEXT
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                resume_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, resume_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS skills (
+                skill TEXT NOT NULL,
+                resume_id INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                PRIMARY KEY (skill, resume_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_resume ON postings (resume_id);
+            CREATE INDEX IF NOT EXISTS skills_resume ON skills (resume_id);
+        ''')
+
+    def close(self):
+        self._db.close()
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+    # Ingestion
+
+    def add(self, name, results, document=None, commit=True):
+        """Index the analyze_resume results for one resume, replacing any old entry
+
+        Term counts come from document, then from the results' 'token_counts'
+        (see analyze_resume), and only otherwise from tokenizing the text.
+        """
+        if document is not None:
+            token_counts = document.token_counts
+        elif results.get('token_counts') is not None:
+            token_counts = results['token_counts']
+        else:
+            token_counts = self.analyzer.prepare_document(results['text']).token_counts
+
+        self.remove(name, commit=False)
+        cursor = self._db.execute(
+            'INSERT INTO resumes (name, email, phone) VALUES (?, ?, ?)',
+            (name, results['email'], results['phone'])
+        )
+        resume_id = cursor.lastrowid
+        self._db.executemany(
+            'INSERT INTO postings (term, resume_id, tf) VALUES (?, ?, ?)',
+            ((term, resume_id, count) for term, count in token_counts.items())
+        )
+        self._db.executemany(
+            'INSERT OR IGNORE INTO skills (skill, resume_id, category) VALUES (?, ?, ?)',
+            ((skill, resume_id, category)
+             for category, skills in results['skills'].items() for skill in skills)
+        )
+        if commit:
+            self._db.commit()
+
+    def remove(self, name, commit=True):
+        """Drop a resume from the index"""
+        row = self._db.execute('SELECT id FROM resumes WHERE name = ?', (name,)).fetchone()
+        if row is not None:
+            self._db.execute('DELETE FROM postings WHERE resume_id = ?', row)
+            self._db.execute('DELETE FROM skills WHERE resume_id = ?', row)
+            self._db.execute('DELETE FROM resumes WHERE id = ?', row)
+        if commit:
+            self._db.commit()
+
+    def ingest(self, name, pdf_file):
+        """Analyze one PDF and index it"""
+        results = self.analyzer.analyze_resume(pdf_file, include_wordcloud=False,
+                                               token_counts=True)
+        self.add(name, results)
+        return results
+
+    def ingest_batch(self, files, workers=None, commit_every=100):
+        """Analyze and index many PDFs in parallel, yielding each batch result"""
+        pending = 0
+        # Workers return term counts so the text is not tokenized again here
+        for item in self.analyzer.analyze_batch(files, workers=workers, token_counts=True):
+            if item['status'] == 'ok':
+                self.add(item['file'], item['result'], commit=False)
+                pending += 1
+                if pending >= commit_every:
+                    self._db.commit()
+                    pending = 0
+            yield item
+        self._db.commit()
+
+    # Queries
+
+    def search(self, query):
+        """Return the names of resumes matching a boolean query
+
+        Supports AND, OR, NOT, parentheses and quoted multi-word skills,
+        e.g. 'python AND (kubernetes OR docker) NOT php'. Operators are
+        case-insensitive and adjacent terms are combined with AND.
+        """
+        tokens = self._tokenize_query(query)
+        if not tokens:
+            return []
+        sql, params = _QueryParser(tokens, self._term_query).parse()
+        return [row[0] for row in self._db.execute(
+            f'SELECT name FROM resumes WHERE id IN ({sql}) ORDER BY name', params
+        )]
+
+    def search_job(self, job_description, top_k=10):
+        """Rank indexed resumes by how many job description keywords they contain
+
+        job_description may be text or a prebuilt JobProfile.
+        """
+        if isinstance(job_description, AnalyzedDocument):
+            job_terms = job_description.token_set
+        else:
+            job_terms = self.analyzer.prepare_document(job_description).token_set
+        if not job_terms:
+            return []
+
+        terms = list(job_terms)
+        placeholders = ', '.join('?' * len(terms))
+        rows = self._db.execute(
+            f'SELECT r.name, COUNT(*) AS hits, SUM(p.tf) AS weight '
+            f'FROM postings p JOIN resumes r ON r.id = p.resume_id '
+            f'WHERE p.term IN ({placeholders}) '
+            f'GROUP BY p.resume_id ORDER BY hits DESC, weight DESC LIMIT ?',
+            (*terms, top_k)
+        ).fetchall()
+
+        return [
+            {'name': name, 'percentage': (hits / len(job_terms)) * 100}
+            for name, hits, _ in rows
+        ]
+
+    def _tokenize_query(self, query):
+        tokens = []
+        for phrase, open_paren, close_paren, word in self.QUERY_TOKEN_PATTERN.findall(query):
+            if open_paren or close_paren:
+                tokens.append(open_paren or close_paren)
+            elif word.upper() in self.OPERATORS:
+                # Operators are case-insensitive; quote "and" or "or" to search for them
+                tokens.append(word.upper())
+            else:
+                tokens.append(('term', (phrase or word).lower()))
+        return tokens
+
+    def _term_query(self, term):
+        """SQL selecting the ids of resumes containing a term, as a skill or as a word"""
+        sql = 'SELECT resume_id AS id FROM skills WHERE skill = ?'
+        params = [term]
+        words = self.analyzer.prepare_document(term).token_set
+        if not words:
+            return sql, params
+
+        # Every word of a multi-word term must be present
+        words_sql = ' INTERSECT '.join(
+            ['SELECT resume_id AS id FROM postings WHERE term = ?'] * len(words)
+        )
+        return f'{sql} UNION SELECT id FROM ({words_sql})', params + sorted(words)
+
+
+class _QueryParser:
+    """Recursive-descent compiler of boolean search queries into SQL
+
+    Every node becomes a (sql, params) pair selecting an 'id' column, and
+    AND, OR and NOT map to INTERSECT, UNION and EXCEPT so SQLite does the
+    set algebra.
+    """
+
+    def __init__(self, tokens, term_query):
+        self.tokens = tokens
+        self.position = 0
+        self.term_query = term_query
+
+    def parse(self):
+        result = self._or()
+        if self.position < len(self.tokens):
+            raise QuerySyntaxError(f"Unexpected {self._describe(self._peek())}")
+        return result
+
+    def _peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _next(self):
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _or(self):
+        result = self._and()
+        while self._peek() == 'OR':
+            self._next()
+            result = self._combine(result, 'UNION', self._and())
+        return result
+
+    def _and(self):
+        result = self._not()
+        while self._peek() not in (None, 'OR', ')'):
+            if self._peek() == 'AND':
+                self._next()
+            result = self._combine(result, 'INTERSECT', self._not())
+        return result
+
+    def _not(self):
+        if self._peek() == 'NOT':
+            self._next()
+            return self._combine(('SELECT id FROM resumes', []), 'EXCEPT', self._not())
+        return self._atom()
+
+    def _atom(self):
+        token = self._next()
+        if token == '(':
+            result = self._or()
+            if self._next() != ')':
+                raise QuerySyntaxError("Missing closing parenthesis")
+            return result
+        if isinstance(token, tuple):
+            return self.term_query(token[1])
+        raise QuerySyntaxError(f"Unexpected {self._describe(token)}")
+
+    @staticmethod
+    def _combine(left, operator, right):
+        # Compound selects chain left to right, so nest each side as a subquery
+        (left_sql, left_params), (right_sql, right_params) = left, right
+        return (f'SELECT id FROM ({left_sql}) {operator} SELECT id FROM ({right_sql})',
+                left_params + right_params)
+
+    @staticmethod
+    def _describe(token):
+        if token is None:
+            return "end of query"
+        if isinstance(token, tuple):
+            return f"term '{token[1]}'"
+        return f"'{token}'"
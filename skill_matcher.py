@@ -0,0 +1,95 @@
+from collections import deque
+
+
+def _is_word_char(char):
+    """Same definition of a word character as the regex \\w class"""
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds every skill in one scan of the text"""
+
+    def __init__(self, skill_keywords):
+        # Categories each skill belongs to, in taxonomy order
+        self.skill_keywords = skill_keywords
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [[]]
+
+        for skills in skill_keywords.values():
+            for skill in skills:
+                self._add(skill.lower())
+
+        self._build_failure_links()
+
+    def _add(self, skill):
+        """Insert a skill into the keyword trie"""
+        state = 0
+        for char in skill:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        if skill not in self._outputs[state]:
+            self._outputs[state].append(skill)
+
+    def _build_failure_links(self):
+        """Breadth-first pass linking each state to its longest proper suffix"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # Inherit matches ending at the suffix state
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                )
+
+    def find_all(self, text):
+        """Return the set of skills found as whole words in lowercase text"""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        found = set()
+        state = 0
+
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for skill in outputs[state]:
+                if skill not in found and self._is_whole_word(text, end - len(skill), end):
+                    found.add(skill)
+
+        return found
+
+    @staticmethod
+    def _is_whole_word(text, start, end):
+        """No word character directly before or after text[start:end]
+
+        Same as (?<!\\w)skill(?!\\w), so skills ending in a symbol such as
+        "c++" or "c#" still match before a space or punctuation.
+        """
+        return ((start == 0 or not _is_word_char(text[start - 1])) and
+                (end == len(text) or not _is_word_char(text[end])))
+
+    def extract(self, text):
+        """Group skills found in text by category"""
+        found = self.find_all(text.lower())
+        found_skills = {}
+
+        for category, skills in self.skill_keywords.items():
+            matched = [skill for skill in skills if skill.lower() in found]
+            if matched:
+                found_skills[category] = matched
+
+        return found_skills
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    import fitz
+
+from resume_analyzer import ResumeAnalyzer, StageResult, results_to_json
+
+RESUME_TEXT = "Jane Doe\njane.doe@example.com\nPython developer with Docker and AWS experience"
+
+
+@pytest.fixture(scope='module')
+def pdf_bytes():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), RESUME_TEXT)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return ResumeAnalyzer(tokenizer='fast')
+
+
+def test_timings_only_when_requested(analyzer, pdf_bytes):
+    results = analyzer.analyze_resume(pdf_bytes, 'python', include_wordcloud=False)
+    assert 'timings' not in results
+    assert 'timings' not in json.loads(json.dumps(results_to_json(results)))
+
+    timed = analyzer.analyze_resume(pdf_bytes, 'python', include_wordcloud=False, timings=True)
+    assert set(timed['timings']) == {'extract', 'contact', 'skills', 'tokenize',
+                                     'frequency', 'match'}
+    assert all(set(times) == {'wall', 'cpu'} for times in timed['timings'].values())
+    del timed['timings']
+    assert timed == results
+
+
+def test_analyze_resume_iter_yields_stage_results(analyzer, pdf_bytes):
+    stages = list(analyzer.analyze_resume_iter(pdf_bytes, 'python', include_wordcloud=False))
+    assert all(isinstance(result, StageResult) for result in stages)
+    assert [result.stage for result in stages] == [stage for stage, _ in ResumeAnalyzer.STAGES]
+    for result, (_, field_names) in zip(stages, ResumeAnalyzer.STAGES):
+        assert set(result.fields) == set(field_names)
+
+    merged = {}
+    for result in stages:
+        merged.update(result.fields)
+    assert merged == analyzer.analyze_resume(pdf_bytes, 'python', include_wordcloud=False)
@@ -0,0 +1,110 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from api import create_app
+
+
+def run_client(check, **app_options):
+    async def main():
+        app = create_app(workers=1, analyzer_options={'tokenizer': 'fast'}, **app_options)
+        async with TestClient(TestServer(app)) as client:
+            await check(client, app['service'])
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize('body', [
+    [1, 2],
+    'resume',
+    {'resume_text': 'python', 'job_description': 'python', 'top_k': 'x'},
+    {'resume_text': 'python', 'job_descriptions': ['python'], 'top_k': True},
+    {'resume_text': 'python', 'job_descriptions': ['python'], 'top_k': 0},
+    {'resume_text': ['python'], 'job_description': 'python'},
+    {'resume_text': 'python', 'job_description': 3},
+    {'resume_text': 'python', 'job_descriptions': 'python'},
+    {'resume_text': 'python', 'job_descriptions': [None]},
+])
+def test_match_rejects_bad_input(body):
+    async def check(client, service):
+        response = await client.post('/match', json=body)
+        assert response.status == 400
+        assert 'error' in await response.json()
+    run_client(check)
+
+
+def test_match():
+    async def check(client, service):
+        response = await client.post('/match', json={
+            'resume_text': 'python developer',
+            'job_descriptions': {'a': 'python java', 'b': 'golang'},
+            'top_k': 1
+        })
+        assert response.status == 200
+        matches = (await response.json())['matches']
+        assert [match['job_id'] for match in matches] == ['a']
+    run_client(check)
+
+
+def test_batch_is_accepted_or_rejected_as_a_whole():
+    async def check(client, service):
+        def form():
+            data = aiohttp.FormData()
+            for n in range(2):
+                data.add_field('files', b'not a pdf', filename=f'{n}.pdf')
+            return data
+
+        # Two files do not fit in the one free slot
+        service.reserve(2)
+        response = await client.post('/batch', data=form())
+        assert response.status == 503
+        assert service.pending == 2
+        service.release(2)
+
+        response = await client.post('/batch', data=form())
+        assert response.status == 200
+        statuses = [item['status'] for item in (await response.json())['results']]
+        assert statuses == ['extraction_error', 'extraction_error']
+        assert service.pending == 0
+    run_client(check, max_pending=3)
+
+
+def test_reserved_slots_count_against_single_requests():
+    async def check(client, service):
+        service.reserve(2)
+        response = await client.post('/match', json={
+            'resume_text': 'python', 'job_description': 'python'
+        })
+        assert response.status == 503
+        service.release(2)
+    run_client(check, max_pending=2)
+
+
+def test_service_replaces_a_broken_pool():
+    async def check(client, service):
+        # Kill the worker running this job
+        with pytest.raises(BrokenProcessPool):
+            await service.run(os._exit, 1)
+        assert service.pending == 0
+
+        response = await client.post('/match', json={
+            'resume_text': 'python', 'job_description': 'python'
+        })
+        assert response.status == 200
+        assert (await response.json())['percentage'] == 100.0
+    run_client(check)
+
+
+def test_batch_larger_than_the_queue_is_rejected():
+    async def check(client, service):
+        form = aiohttp.FormData()
+        for n in range(3):
+            form.add_field('files', b'not a pdf', filename=f'{n}.pdf')
+        response = await client.post('/batch', data=form)
+        assert response.status == 413
+        assert (await response.json())['error'] == "At most 2 files per batch"
+        assert 'Retry-After' not in response.headers
+    run_client(check, max_pending=2)
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from contact_extractor import ContactExtractor
+
+RESUME = (
+    "Jane Doe\n"
+    "Engineer | jane.doe@example.com | +1 (555) 123-4567\n"
+    "Profile: https://www.LinkedIn.com/in/janedoe, code at github.com/janedoe.\n"
+    "Contact me at other@example.com or 555-987-6543\n"
+    "Blog www.example.org and again https://www.LinkedIn.com/in/janedoe\n"
+)
+
+
+@pytest.fixture
+def extractor():
+    return ContactExtractor()
+
+
+def test_extract(extractor):
+    assert extractor.extract(RESUME) == {
+        'email': 'jane.doe@example.com',
+        'phone': '+1 (555) 123-4567',
+        'urls': ['https://www.LinkedIn.com/in/janedoe', 'github.com/janedoe',
+                 'www.example.org'],
+        'linkedin': 'janedoe'
+    }
+
+
+def test_extract_without_contacts(extractor):
+    assert extractor.extract("Nothing to see here") == {
+        'email': 'Not found', 'phone': 'Not found', 'urls': [], 'linkedin': 'Not found'
+    }
+
+
+def test_url_scan_matches_line_walk(extractor):
+    rng = random.Random(0)
+    parts = ['https://', 'www.', 'WWW.', 'LinkedIn.com/in/x', 'github.com/a', 'http://a.b/c',
+             '\n', '\r\n', ' ', 'x', '.', ',', '(', ')', '"', 'İ', ' ']
+    for _ in range(5000):
+        text = ''.join(rng.choice(parts) for _ in range(rng.randint(0, 30)))
+        assert extractor.extract_urls(text) == extractor._extract_urls_by_line(text)
@@ -0,0 +1,158 @@
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    import fitz
+
+from corpus_store import CorpusStore, CorpusWriter
+from resume_analyzer import ResumeAnalyzer
+
+WORDS = ('python docker kubernetes aws java golang sql react node.js c++ '
+         'machine learning data pipelines team lead 2024 naïve résumé').split()
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return ResumeAnalyzer(tokenizer='fast')
+
+
+@pytest.fixture(scope='module')
+def resumes(analyzer):
+    rng = random.Random(0)
+    resumes = []
+    for n in range(30):
+        text = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 80)))
+        results = {
+            'text': text,
+            'skills': analyzer.extract_skills(text),
+            'email': f'person{n}@example.com' if n % 3 else None,
+            'phone': '+1 555 0100' if n % 2 else None,
+            'linkedin': None,
+        }
+        resumes.append((f'résumé-{n}.pdf', results))
+    return resumes
+
+
+@pytest.fixture(scope='module')
+def corpus_path(analyzer, resumes, tmp_path_factory):
+    writer = CorpusWriter(analyzer)
+    for name, results in resumes:
+        writer.add(name, results)
+    path = tmp_path_factory.mktemp('corpus') / 'corpus.bin'
+    writer.write(path)
+    return path
+
+
+def test_round_trip(analyzer, resumes, corpus_path):
+    with CorpusStore(corpus_path) as store:
+        assert len(store) == len(resumes)
+        for index, (name, results) in enumerate(resumes):
+            document = analyzer.prepare_document(results['text'])
+            encoded = store.document(index)
+            assert dict(zip(store.vocabulary.decode(encoded.term_ids),
+                            encoded.counts.tolist())) == document.token_counts
+            assert np.all(np.diff(encoded.term_ids.astype(np.int64)) > 0)
+            assert (analyzer.get_word_frequency(None, document=encoded)
+                    == analyzer.get_word_frequency(results['text']))
+
+            record = store.record(index)
+            assert record['name'] == name
+            assert record['email'] == results['email']
+            assert record['phone'] == results['phone']
+            assert record['linkedin'] is None
+            assert record['skills'] == results['skills']
+        # Views onto the mapping must be gone before it is closed
+        del encoded
+
+
+def test_sections_are_aligned_views(corpus_path):
+    with CorpusStore(corpus_path) as store:
+        for array in (store.doc_offsets, store.term_ids, store.counts, store.first_seen):
+            assert not array.flags.owndata
+            assert array.ctypes.data % array.dtype.itemsize == 0
+        assert (store.doc_offsets[-1] == len(store.term_ids) == len(store.counts)
+                == len(store.first_seen))
+        del array
+
+
+@pytest.mark.parametrize('job', [
+    'python docker kubernetes',
+    'Machine learning engineer with SQL, React and Rust',
+    'haskell erlang',
+])
+def test_score_matches_calculate_job_match(analyzer, resumes, corpus_path, job):
+    job_profile = analyzer.build_job_profile(job)
+    with CorpusStore(corpus_path) as store:
+        matches = store.score(job, top_k=len(resumes))
+        assert len(matches) == len(resumes)
+        percentages = [match['percentage'] for match in matches]
+        assert percentages == sorted(percentages, reverse=True)
+
+        by_name = {match['name']: match for match in matches}
+        for name, results in resumes:
+            percentage, matching, missing = analyzer.calculate_job_match(results['text'], job)
+            match = by_name[name]
+            assert match['percentage'] == pytest.approx(percentage)
+            assert match['matching_keywords'] == matching
+            assert match['missing_keywords'] == missing
+            resume_skills = {skill for found in results['skills'].values() for skill in found}
+            assert match['matched_skills'] == sorted(resume_skills & job_profile.skill_set)
+
+
+def test_empty_corpus(analyzer, tmp_path):
+    path = tmp_path / 'empty.bin'
+    CorpusWriter(analyzer).write(path)
+    with CorpusStore(path) as store:
+        assert len(store) == 0
+        assert len(store.vocabulary) == 0
+        assert store.score('python') == []
+
+
+def test_pickle_reopens_the_file(corpus_path):
+    with CorpusStore(corpus_path) as store:
+        with pickle.loads(pickle.dumps(store)) as copy:
+            assert len(copy) == len(store)
+            assert np.array_equal(copy.term_ids, store.term_ids)
+            assert copy.record(1) == store.record(1)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a corpus store file')
+    with pytest.raises(ValueError, match='not a corpus store file'):
+        CorpusStore(path)
+
+
+def test_ingest_batch_uses_worker_token_counts(analyzer, tmp_path, monkeypatch):
+    texts = {'a': "Python developer with Docker", 'b': "Java and Kubernetes engineer"}
+    paths = []
+    for name, text in texts.items():
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), text)
+        path = tmp_path / f'{name}.pdf'
+        doc.save(path)
+        doc.close()
+        paths.append(str(path))
+
+    writer = CorpusWriter(ResumeAnalyzer(tokenizer='fast'))
+
+    def fail(text):
+        raise AssertionError("batch results were tokenized again in the parent")
+
+    monkeypatch.setattr(writer.analyzer, 'prepare_document', fail)
+    items = list(writer.ingest_batch(paths, workers=2))
+    monkeypatch.undo()
+    assert [item['status'] for item in items] == ['ok', 'ok']
+
+    writer.write(tmp_path / 'corpus.bin')
+    with CorpusStore(tmp_path / 'corpus.bin') as store:
+        names = [store.record(index)['name'] for index in range(len(store))]
+        assert sorted(names) == sorted(paths)
+        top = store.score('python docker', top_k=1)[0]
+        assert top['name'] == paths[0]
+        assert top['percentage'] == 100.0
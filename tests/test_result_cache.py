@@ -0,0 +1,56 @@
+from io import BytesIO
+
+import pytest
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    import fitz
+
+from result_cache import ResultCache
+from resume_analyzer import ExtractionError, ResumeAnalyzer
+
+RESUME_TEXT = "Jane Doe\njane.doe@example.com\nPython developer with Docker and AWS experience"
+
+
+@pytest.fixture(scope='module')
+def pdf_bytes():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), RESUME_TEXT)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def analyzer():
+    return ResumeAnalyzer(cache=ResultCache(), tokenizer='fast')
+
+
+def test_bytes_path_and_stream_share_one_entry(analyzer, pdf_bytes, tmp_path):
+    path = tmp_path / 'resume.pdf'
+    path.write_bytes(pdf_bytes)
+
+    from_bytes = analyzer.analyze_resume(pdf_bytes, 'python', include_wordcloud=False)
+    from_path = analyzer.analyze_resume(str(path), 'python', include_wordcloud=False)
+    from_stream = analyzer.analyze_resume(BytesIO(pdf_bytes), 'python', include_wordcloud=False)
+
+    assert from_bytes['email'] == 'jane.doe@example.com'
+    assert from_bytes == from_path == from_stream
+    assert len(analyzer.cache._memory) == 1
+
+
+def test_oversized_input_is_rejected_before_hashing(analyzer, pdf_bytes, tmp_path, monkeypatch):
+    monkeypatch.setattr(ResumeAnalyzer, 'MAX_PDF_BYTES', len(pdf_bytes) - 1)
+    path = tmp_path / 'resume.pdf'
+    path.write_bytes(pdf_bytes)
+
+    for source in (pdf_bytes, str(path), BytesIO(pdf_bytes)):
+        with pytest.raises(ExtractionError, match='larger than'):
+            analyzer.analyze_resume(source, include_wordcloud=False)
+    assert not analyzer.cache._memory
+
+
+def test_make_key_hashes_files_like_bytes(pdf_bytes):
+    assert (ResultCache.make_key(BytesIO(pdf_bytes), 'job', False)
+            == ResultCache.make_key(pdf_bytes, 'job', False))
@@ -0,0 +1,129 @@
+import pytest
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    import fitz
+
+from resume_analyzer import ResumeAnalyzer
+from resume_index import QuerySyntaxError, ResumeIndex
+
+RESUMES = {
+    'alice': ("Python developer shipping Kubernetes services",
+              {'programming': ['python'], 'devops': ['kubernetes']}),
+    'bob': ("Docker and PHP web developer",
+            {'programming': ['php'], 'devops': ['docker']}),
+    'carol': ("Machine learning engineer, Python and Docker",
+              {'programming': ['python'], 'devops': ['docker'],
+               'data_science': ['machine learning']}),
+    'dave': ("Technical writer",
+             {}),
+}
+
+
+def make_results(text, skills):
+    return {'text': text, 'email': None, 'phone': None, 'skills': skills}
+
+
+@pytest.fixture
+def index():
+    index = ResumeIndex(':memory:', analyzer=ResumeAnalyzer(tokenizer='fast'))
+    for name, (text, skills) in RESUMES.items():
+        index.add(name, make_results(text, skills))
+    yield index
+    index.close()
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('python', ['alice', 'carol']),
+    ('python AND docker', ['carol']),
+    ('python docker', ['carol']),
+    ('python OR php', ['alice', 'bob', 'carol']),
+    ('python or php', ['alice', 'bob', 'carol']),
+    ('python and docker', ['carol']),
+    ('docker not python', ['bob']),
+    ('Python And (Kubernetes Or Docker)', ['alice', 'carol']),
+    ('NOT python', ['bob', 'dave']),
+    ('docker NOT python', ['bob']),
+    ('python AND (kubernetes OR docker) NOT php', ['alice', 'carol']),
+    ('NOT NOT kubernetes', ['alice']),
+    ('"machine learning"', ['carol']),
+    ('"web developer"', ['bob']),
+    ('"developer web"', ['bob']),
+    ('rust', []),
+    ('NOT rust', ['alice', 'bob', 'carol', 'dave']),
+    ('(php OR rust) OR (writer AND technical)', ['bob', 'dave']),
+])
+def test_search(index, query, expected):
+    assert index.search(query) == expected
+
+
+def test_search_matches_python_set_algebra(index):
+    def ids(term):
+        return set(index.search(term))
+
+    everyone = set(RESUMES)
+    assert set(index.search('python OR docker NOT php')) == (
+        ids('python') | (ids('docker') & (everyone - ids('php')))
+    )
+    assert set(index.search('(python OR docker) NOT (php OR kubernetes)')) == (
+        (ids('python') | ids('docker')) - (ids('php') | ids('kubernetes'))
+    )
+
+
+def test_empty_query(index):
+    assert index.search('   ') == []
+
+
+@pytest.mark.parametrize('query, message', [
+    ('python AND', 'end of query'),
+    ('(python OR docker', 'Missing closing parenthesis'),
+    ('python )', r"Unexpected '\)'"),
+    ('OR python', "Unexpected 'OR'"),
+    ('or python', "Unexpected 'OR'"),
+])
+def test_syntax_errors(index, query, message):
+    with pytest.raises(QuerySyntaxError, match=message):
+        index.search(query)
+
+
+def test_add_replaces_and_remove_drops(index):
+    index.add('bob', make_results("Rust systems programmer", {}))
+    assert index.search('php') == []
+    assert index.search('rust') == ['bob']
+
+    index.remove('bob')
+    assert len(index) == 3
+    assert index.search('rust') == []
+
+
+def test_search_job(index):
+    ranked = index.search_job("Python and Docker")
+    assert ranked[0] == {'name': 'carol', 'percentage': 100.0}
+    assert sorted(match['name'] for match in ranked[1:]) == ['alice', 'bob']
+    assert ranked[1]['percentage'] == 50.0
+
+
+def test_ingest_batch_uses_worker_token_counts(tmp_path, monkeypatch):
+    paths = []
+    for name, (text, _) in RESUMES.items():
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), text)
+        path = tmp_path / f'{name}.pdf'
+        doc.save(path)
+        doc.close()
+        paths.append(str(path))
+
+    index = ResumeIndex(':memory:', analyzer=ResumeAnalyzer(tokenizer='fast'))
+
+    def fail(text):
+        raise AssertionError("batch results were tokenized again in the parent")
+
+    monkeypatch.setattr(index.analyzer, 'prepare_document', fail)
+    items = list(index.ingest_batch(paths, workers=2))
+
+    assert [item['status'] for item in items] == ['ok'] * len(paths)
+    assert len(index) == len(paths)
+    monkeypatch.undo()
+    assert index.search('kubernetes') == [paths[0]]
+    index.close()
@@ -0,0 +1,55 @@
+import random
+import re
+
+import pytest
+
+from skill_matcher import SkillMatcher
+
+SKILLS = {
+    'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'go', 'r'],
+    'web': ['next.js', 'node.js', 'react'],
+    'data_science': ['machine learning', 'scikit-learn', 'power bi'],
+}
+
+
+def reference(text):
+    """Skills found by the regex the matcher replaces"""
+    return {
+        skill for skills in SKILLS.values() for skill in skills
+        if re.search(r'(?<!\w)' + re.escape(skill) + r'(?!\w)', text)
+    }
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return SkillMatcher(SKILLS)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('i know c++ and c# and next.js.', {'c++', 'c#', 'next.js'}),
+    ('c++, c#; python', {'c++', 'c#', 'python'}),
+    ('c++11 and c#9', set()),
+    ('javascript developer', {'javascript'}),
+    ('java/python', {'java', 'python'}),
+    ('go-to person in r&d', {'go', 'r'}),
+    ('mongodb, golang, rust', set()),
+    ('machine learning with scikit-learn', {'machine learning', 'scikit-learn'}),
+    ('machine  learning', set()),
+    ('', set()),
+])
+def test_find_all_examples(matcher, text, expected):
+    assert matcher.find_all(text) == expected
+
+
+def test_find_all_matches_regex_on_random_text(matcher):
+    rng = random.Random(0)
+    pieces = [skill for skills in SKILLS.values() for skill in skills]
+    pieces += ['a', 'x1', '_', ' ', ' ', '.', ',', '+', '#', '-', '/', '(', ')', 'ing']
+    for _ in range(2000):
+        text = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+        assert matcher.find_all(text) == reference(text), text
+
+
+def test_extract_groups_by_category_in_taxonomy_order(matcher):
+    found = matcher.extract('React, Node.js, C# and Python')
+    assert found == {'programming': ['python', 'c#'], 'web': ['node.js', 'react']}
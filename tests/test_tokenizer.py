@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from benchmarks.bench_tokenizer import PARITY_CORPUS
+from resume_analyzer import ResumeAnalyzer
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return ResumeAnalyzer(tokenizer='fast')
+
+
+@pytest.fixture(scope='module')
+def word_tokenize():
+    nltk_tokenize = pytest.importorskip('nltk.tokenize')
+    try:
+        nltk_tokenize.word_tokenize("probe")
+    except LookupError:
+        pytest.skip("NLTK punkt data not installed (see download_nltk_data.py)")
+    return nltk_tokenize.word_tokenize
+
+
+@pytest.mark.parametrize('sample', PARITY_CORPUS + [
+    "go. skills",
+    "b.sc. in computer science",
+    "experience. python, docker. kubernetes",
+    "skills e.g. python etc. and more",
+    "ends with e.g.",
+])
+def test_fast_matches_word_tokenize(analyzer, word_tokenize, sample):
+    cleaned = analyzer.clean_text(sample)
+    assert analyzer.tokenize(cleaned) == word_tokenize(cleaned)
+
+
+@pytest.mark.parametrize('alphabet', ['ab1.+# ', 'abcxyz0123456789.+# ', 'ab.#'])
+def test_fast_matches_treebank_without_sentence_breaks(analyzer, alphabet):
+    # Without '. ' Punkt keeps the text as one sentence, so word_tokenize
+    # reduces to the Treebank tokenizer, which needs no downloaded data
+    treebank = pytest.importorskip('nltk.tokenize').NLTKWordTokenizer()
+    rng = random.Random(0)
+    for _ in range(5000):
+        cleaned = ' '.join(
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 20))).split()
+        )
+        if not cleaned or '. ' in cleaned:
+            continue
+        assert analyzer.tokenize(cleaned) == treebank.tokenize(cleaned), cleaned
+
+
+@pytest.mark.parametrize('cleaned, expected', [
+    # Sentence-final periods are split off, mid-text as well as at the end
+    ('go. skills', ['go', '.', 'skills']),
+    ('b.sc. in computer science', ['b.sc', '.', 'in', 'computer', 'science']),
+    ('python.', ['python', '.']),
+    # Abbreviations keep their period unless they end the text
+    ('tools e.g. docker', ['tools', 'e.g.', 'docker']),
+    ('etc. and more', ['etc.', 'and', 'more']),
+    ('ends with e.g.', ['ends', 'with', 'e.g', '.']),
+    # Initials and numbers keep it before a lowercase word
+    ('j. doe', ['j.', 'doe']),
+    ('since 2019. led', ['since', '2019.', 'led']),
+    ('2018. 2019', ['2018', '.', '2019']),
+    # Dotted names, '#' and runs of dots
+    ('next.js and .net core', ['next.js', 'and', '.net', 'core']),
+    ('c# c++ #1', ['c', '#', 'c++', '#', '1']),
+    ('skills.#1 python', ['skills.', '#', '1', 'python']),
+    ('a.#.', ['a.', '#', '.']),
+    ('wait... what', ['wait', '...', 'what']),
+])
+def test_fast_tokenizer_rules(analyzer, cleaned, expected):
+    assert analyzer.tokenize(cleaned) == expected
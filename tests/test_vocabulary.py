@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from resume_analyzer import ResumeAnalyzer
+from vocabulary import Vocabulary
+
+WORDS = ('python docker kubernetes aws java golang sql react node.js c++ '
+         'data pipelines machine learning 2024 x1 team lead').split()
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return ResumeAnalyzer(tokenizer='fast')
+
+
+@pytest.fixture(scope='module')
+def texts():
+    rng = random.Random(0)
+    return [' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 60))) for _ in range(50)]
+
+
+def test_encoded_match_equals_string_match(analyzer, texts):
+    vocabulary = Vocabulary()
+    encoded = [analyzer.encode_document(text, vocabulary) for text in texts]
+    # Jobs with terms no resume contains, which the vocabulary has never seen
+    jobs = ['python docker rust', 'haskell erlang', texts[0], '']
+
+    for job in jobs:
+        job_profile = analyzer.build_job_profile(job)
+        for text, document in zip(texts, encoded):
+            expected = analyzer.calculate_job_match(text, job)
+            assert analyzer.calculate_job_match(None, job, document=document) == expected
+            assert analyzer.calculate_job_match(None, job_profile, document=document) == expected
+
+
+def test_matching_text_jobs_does_not_grow_the_vocabulary(analyzer, texts):
+    vocabulary = Vocabulary()
+    document = analyzer.encode_document(texts[1], vocabulary)
+    size = len(vocabulary)
+
+    percentage, matching, missing = analyzer.calculate_job_match(
+        None, 'python haskell erlang', document=document
+    )
+    assert len(vocabulary) == size
+    assert 'haskell' not in vocabulary
+    assert {'haskell', 'erlang'} <= missing
+
+
+def test_encoded_job_against_encoded_resume(analyzer, texts):
+    vocabulary = Vocabulary()
+    encoded = [analyzer.encode_document(text, vocabulary) for text in texts]
+    job = analyzer.encode_document(texts[2], vocabulary)
+    for text, document in zip(texts, encoded):
+        assert (analyzer.calculate_job_match(None, job, document=document)
+                == analyzer.calculate_job_match(text, texts[2]))
+
+
+def test_word_frequency_parity(analyzer, texts):
+    vocabulary = Vocabulary()
+    for text in texts:
+        document = analyzer.encode_document(text, vocabulary)
+        assert (analyzer.get_word_frequency(None, document=document)
+                == analyzer.get_word_frequency(text))
+
+
+def test_save_and_load_preserve_ids(tmp_path):
+    vocabulary = Vocabulary(['python', 'docker', 'c++'])
+    path = tmp_path / 'vocabulary.json'
+    vocabulary.save(path)
+    loaded = Vocabulary.load(path)
+    assert loaded.terms == vocabulary.terms
+    assert loaded.id_of('c++') == 2
+
+
+def test_jobs_encoded_without_growing_keep_unknown_terms(analyzer):
+    vocabulary = Vocabulary()
+    document = analyzer.encode_document('python docker', vocabulary)
+    job = vocabulary.encode_document(analyzer.prepare_document('python haskell'), grow=False)
+
+    assert job.unknown_terms == {'haskell'}
+    assert 'haskell' not in vocabulary
+    assert (analyzer.calculate_job_match(None, job, document=document)
+            == analyzer.calculate_job_match('python docker', 'python haskell')
+            == (50.0, {'python'}, {'haskell'}))
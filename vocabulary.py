@@ -0,0 +1,157 @@
+import json
+
+import numpy as np
+
+
+class Vocabulary:
+    """Shared term <-> integer id table for holding large corpora compactly
+
+    Each distinct term is stored once; documents then keep only uint32 ids
+    and counts instead of Python strings in lists, sets and Counters.
+    """
+
+    def __init__(self, terms=()):
+        self._ids = {}
+        self.terms = []
+        # 1 for purely alphabetic terms, indexed by id
+        self._alpha = bytearray()
+        for term in terms:
+            self.add(term)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, term):
+        return term in self._ids
+
+    def add(self, term):
+        """Id of a term, assigning the next free one if it is new"""
+        term_id = self._ids.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self._ids[term] = term_id
+            self.terms.append(term)
+            self._alpha.append(term.isalpha())
+        return term_id
+
+    def id_of(self, term):
+        """Id of a known term, or None"""
+        return self._ids.get(term)
+
+    def encode(self, tokens, grow=True):
+        """Token ids as a uint32 array; with grow=False unknown tokens are dropped"""
+        ids = self._ids
+        if grow:
+            for token in tokens:
+                if token not in ids:
+                    self.add(token)
+            return np.fromiter((ids[token] for token in tokens), dtype=np.uint32,
+                               count=len(tokens))
+        return np.array([ids[token] for token in tokens if token in ids], dtype=np.uint32)
+
+    def encode_document(self, document, grow=True):
+        """Sparse term counts of an AnalyzedDocument's filtered tokens
+
+        With grow=False, terms outside the vocabulary are left out of the
+        ids and kept in the result's unknown_terms instead.
+        """
+        unknown_terms = frozenset()
+        if not grow:
+            unknown_terms = frozenset(
+                term for term in document.token_set if term not in self._ids
+            )
+        return EncodedDocument.from_token_ids(self, self.encode(document.filtered_tokens, grow),
+                                              unknown_terms)
+
+    def encode_counts(self, token_counts):
+        """Sparse term counts from a {term: count} mapping such as a token Counter
+
+        The mapping's order, which for a Counter is first occurrence, becomes
+        first_seen.
+        """
+        term_ids = np.fromiter((self.add(term) for term in token_counts), dtype=np.uint32,
+                               count=len(token_counts))
+        counts = np.fromiter(token_counts.values(), dtype=np.uint32, count=len(token_counts))
+        order = np.argsort(term_ids)
+        return EncodedDocument(self, term_ids[order], counts[order], order.astype(np.uint32))
+
+    def decode(self, term_ids):
+        terms = self.terms
+        return [terms[term_id] for term_id in term_ids.tolist()]
+
+    def alpha_mask(self, term_ids):
+        """True for ids whose term is purely alphabetic"""
+        return np.frombuffer(self._alpha, dtype=np.bool_)[term_ids]
+
+    def save(self, path):
+        """Write the terms, in id order, to a JSON file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.terms, f)
+
+    @classmethod
+    def load(cls, path):
+        """Read a vocabulary written by save(); ids are preserved"""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+
+class EncodedDocument:
+    """A document's filtered tokens as a sparse count vector over a Vocabulary
+
+    term_ids holds each distinct term once, sorted by id so documents can
+    be intersected by binary search. counts and first_seen give, at the
+    same position, the term's count and where it first occurred, which
+    orders ties in most_common. unknown_terms holds the distinct terms
+    dropped because the vocabulary did not know them, so matching can
+    still count them as missing.
+    """
+
+    __slots__ = ('vocabulary', 'term_ids', 'counts', 'first_seen', 'unknown_terms', '_terms')
+
+    def __init__(self, vocabulary, term_ids, counts, first_seen, unknown_terms=frozenset()):
+        self.vocabulary = vocabulary
+        self.term_ids = term_ids
+        self.counts = counts
+        self.first_seen = first_seen
+        self.unknown_terms = unknown_terms
+        self._terms = None
+
+    @classmethod
+    def from_token_ids(cls, vocabulary, token_ids, unknown_terms=frozenset()):
+        # np.unique returns the ids sorted, with each one's first index
+        term_ids, first_seen, counts = np.unique(token_ids, return_index=True,
+                                                 return_counts=True)
+        return cls(vocabulary, term_ids, counts.astype(np.uint32),
+                   first_seen.astype(np.uint32), unknown_terms)
+
+    def __len__(self):
+        return len(self.term_ids)
+
+    @property
+    def nbytes(self):
+        return self.term_ids.nbytes + self.counts.nbytes + self.first_seen.nbytes
+
+    @property
+    def terms(self):
+        """Distinct terms as strings in term_ids order, decoded on first use and kept
+
+        Worth it for a job matched against many resumes; corpus documents
+        that never ask stay compact.
+        """
+        if self._terms is None:
+            self._terms = self.vocabulary.decode(self.term_ids)
+        return self._terms
+
+    @property
+    def token_set(self):
+        """Distinct terms as strings, for code that expects AnalyzedDocument"""
+        return set(self.terms)
+
+    def most_common(self, n, alpha_only=False):
+        """Top n {term: count}, ties kept in order of first occurrence like Counter"""
+        term_ids, counts, first_seen = self.term_ids, self.counts, self.first_seen
+        if alpha_only:
+            mask = self.vocabulary.alpha_mask(term_ids)
+            term_ids, counts, first_seen = term_ids[mask], counts[mask], first_seen[mask]
+        top = np.lexsort((first_seen, -counts.astype(np.int64)))[:n]
+        return dict(zip(self.vocabulary.decode(term_ids[top]), counts[top].tolist()))